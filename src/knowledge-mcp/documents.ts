@@ -1,10 +1,33 @@
 import { randomBytes } from 'crypto';
-import { readFileSync, writeFileSync, mkdirSync, existsSync, readdirSync } from 'fs';
-import { access, readFile, writeFile, mkdir, readdir } from 'fs/promises';
-import { tmpdir } from 'os';
-import { join, dirname } from 'path';
+import {
+  openSync,
+  readSync,
+  closeSync,
+  readFileSync,
+  writeFileSync,
+  mkdirSync,
+  existsSync,
+  readdirSync,
+  statSync,
+  renameSync,
+  unlinkSync,
+} from 'fs';
+import type { BigIntStats } from 'fs';
+import {
+  access,
+  open,
+  readFile,
+  writeFile,
+  mkdir,
+  readdir,
+  stat,
+  rename,
+  unlink,
+} from 'fs/promises';
+import type { FileHandle } from 'fs/promises';
+import { basename, join, dirname, resolve } from 'path';
+import { StringDecoder } from 'string_decoder';
 
-import fm from 'front-matter';
 import * as yaml from 'js-yaml';
 
 export interface DocumentMetadata {
@@ -22,6 +45,11 @@ export interface Chapter {
   content: string;
 }
 
+export interface DocumentSections {
+  introduction: string;
+  chapters: Chapter[];
+}
+
 export interface SearchResult {
   file: string;
   match_count: number;
@@ -36,34 +64,113 @@ export interface MatchingChapter {
   chapter_summary: string;
 }
 
+// Frontmatter block at the start of a document (same delimiters as front-matter).
+// Sticky, so a document is never scanned past its first line for a block.
+const FRONTMATTER_REGEX = /^(\ufeff?(= yaml =|---)$([\s\S]*?)^(?:\2|\.\.\.)\s*$(?:\n)?)/my;
+
+// Plain scalars js-yaml resolves to strings: letter-first words without YAML
+// indicators, minus the core schema's null and boolean spellings
+const SIMPLE_PLAIN_SCALAR = /^[A-Za-z](?:[A-Za-z0-9 _.-]*[A-Za-z0-9_.-])?$/;
+const NON_STRING_PLAIN_SCALARS = new Set([
+  'null',
+  'Null',
+  'NULL',
+  'true',
+  'True',
+  'TRUE',
+  'false',
+  'False',
+  'FALSE',
+]);
+const SIMPLE_SINGLE_QUOTED = /^'((?:[^']|'')*)'$/;
+const SIMPLE_MAPPING_LINE = /^([A-Za-z_][A-Za-z0-9_]*):(?: (.+))?$/;
+const SIMPLE_SEQUENCE_ITEM = /^( *)- (.+)$/;
+
 /**
- * Parse a markdown document with frontmatter.
- * Returns tuple of [metadata, body content]
+ * Parse a single-line scalar the way js-yaml would, or return null when it
+ * isn't certain to be a plain string.
  */
-export function parseDocument(content: string): [DocumentMetadata, string] {
-  try {
-    const parsed = fm(content);
-
-    // Ensure metadata is an object
-    const metadata = (parsed.attributes as DocumentMetadata) || {};
-
-    // Validate YAML safety by re-parsing with safe_load
-    if (content.startsWith('---')) {
-      const fmMatch = content.match(/^---\n(.*?)\n---/s);
-      if (fmMatch) {
-        const yamlContent = fmMatch[1];
-        try {
-          // Verify it can be safely loaded
-          yaml.load(yamlContent);
-        } catch (error) {
-          throw new Error(
-            `Invalid YAML frontmatter: ${error instanceof Error ? error.message : String(error)}`
-          );
+function parseSimpleScalar(text: string): string | null {
+  if (SIMPLE_PLAIN_SCALAR.test(text)) {
+    return NON_STRING_PLAIN_SCALARS.has(text) ? null : text;
+  }
+  const quoted = SIMPLE_SINGLE_QUOTED.exec(text);
+  return quoted ? quoted[1].replace(/''/g, "'") : null;
+}
+
+/**
+ * Parse frontmatter in the flat shape serializeDocument writes: string
+ * values and block lists of strings, one key per line. This skips the
+ * general YAML parser for nearly every stored document. Returns null for
+ * anything outside that subset, which is then left to js-yaml.
+ */
+function parseSimpleFrontmatter(text: string): DocumentMetadata | null {
+  const metadata: Record<string, unknown> = {};
+  const lines = text.split('\n');
+
+  for (let i = 0; i < lines.length; i++) {
+    const entry = SIMPLE_MAPPING_LINE.exec(lines[i]);
+    if (!entry || entry[1] === '__proto__' || Object.hasOwn(metadata, entry[1])) {
+      return null;
+    }
+    const [, key, value] = entry;
+
+    if (value === undefined) {
+      // Block sequence with every item at the same indentation
+      const items: string[] = [];
+      let indent: string | undefined;
+      while (i + 1 < lines.length) {
+        const item = SIMPLE_SEQUENCE_ITEM.exec(lines[i + 1]);
+        if (!item) {
+          break;
+        }
+        indent ??= item[1];
+        const scalar = item[1] === indent ? parseSimpleScalar(item[2]) : null;
+        if (scalar === null) {
+          return null;
         }
+        items.push(scalar);
+        i++;
+      }
+      if (indent !== '' && indent !== '  ') {
+        return null;
       }
+      metadata[key] = items;
+    } else if (value === '[]') {
+      metadata[key] = [];
+    } else {
+      const scalar = parseSimpleScalar(value);
+      if (scalar === null) {
+        return null;
+      }
+      metadata[key] = scalar;
     }
+  }
+
+  return metadata as DocumentMetadata;
+}
+
+/**
+ * Check whether content can begin with a frontmatter block at all.
+ */
+function mayHaveFrontmatter(content: string): boolean {
+  return (
+    content.startsWith('---') || content.startsWith('= yaml =') || content.startsWith('\ufeff')
+  );
+}
 
-    return [metadata, parsed.body];
+/**
+ * Parse the YAML inside a frontmatter block.
+ */
+function parseFrontmatter(frontmatter: string): DocumentMetadata {
+  const simpleMetadata = parseSimpleFrontmatter(frontmatter);
+  if (simpleMetadata) {
+    return simpleMetadata;
+  }
+
+  try {
+    // js-yaml 4 load() is safe by default, so a single parse both reads and validates
+    return (yaml.load(frontmatter) as DocumentMetadata) || {};
   } catch (error) {
     if (error instanceof Error) {
       if (error.message.includes('constructor')) {
@@ -76,53 +183,93 @@ export function parseDocument(content: string): [DocumentMetadata, string] {
 }
 
 /**
- * Parse markdown content into chapters based on headers.
+ * Parse a markdown document with frontmatter.
+ * Returns tuple of [metadata, body content]
  */
-export function parseChapters(content: string): Chapter[] {
+export function parseDocument(content: string): [DocumentMetadata, string] {
+  // Fast path for documents without frontmatter
+  if (!mayHaveFrontmatter(content)) {
+    return [{}, content];
+  }
+
+  FRONTMATTER_REGEX.lastIndex = 0;
+  const fmMatch = FRONTMATTER_REGEX.exec(content);
+  if (!fmMatch) {
+    return [{}, content];
+  }
+
+  return [parseFrontmatter(fmMatch[3].trim()), content.slice(fmMatch[0].length)];
+}
+
+// Chapter header line: level marker and title
+const CHAPTER_HEADER_REGEX = /^(#{2,4})\s+(.+)$/;
+
+/**
+ * Extract a chapter summary from the lines following its header.
+ * Takes the first paragraph, stopping once it exceeds 100 characters.
+ */
+function extractSummary(contentLines: string[]): string {
+  const summaryLines: string[] = [];
+  // Length of summaryLines.join(' '), tracked incrementally
+  let summaryLength = -1;
+
+  // Look for summary lines - stop at empty line or after 2-3 lines
+  for (let j = 0; j < contentLines.length; j++) {
+    const cl = contentLines[j].trim();
+    if (!cl) {
+      if (summaryLines.length > 0) {
+        // Empty line after content - stop
+        break;
+      }
+      continue;
+    }
+
+    summaryLines.push(cl);
+    summaryLength += cl.length + 1;
+    // Check if next line is empty (end of summary paragraph)
+    if (j + 1 < contentLines.length && !contentLines[j + 1].trim()) {
+      break;
+    }
+    // Or stop after getting a reasonable summary
+    if (summaryLength > 100) {
+      break;
+    }
+  }
+
+  return summaryLines.join(' ');
+}
+
+/**
+ * Parse markdown content into the introduction before the first header
+ * and the chapters that follow it.
+ */
+export function parseSections(content: string): DocumentSections {
   if (!content.trim()) {
-    return [];
+    return { introduction: content, chapters: [] };
   }
 
   const chapters: Chapter[] = [];
   const lines = content.split('\n');
 
+  // Lines before the first header
+  let introductionEnd = lines.length;
+
   let currentChapter: Chapter | null = null;
   let chapterLines: string[] = [];
 
-  for (const line of lines) {
-    // Check for markdown headers (##, ###, ####)
-    const headerMatch = line.match(/^(#{2,4})\s+(.+)$/);
+  for (let i = 0; i < lines.length; i++) {
+    const line = lines[i];
+    // Check for markdown headers (##, ###, ####); most lines don't start with '#'
+    const headerMatch = line.startsWith('##') ? CHAPTER_HEADER_REGEX.exec(line) : null;
 
     if (headerMatch) {
       // Save previous chapter if exists
       if (currentChapter) {
-        // Extract summary from chapter content
-        const contentLines = chapterLines.slice(1); // Skip header line
-        const summaryLines: string[] = [];
-
-        // Look for summary lines - stop at empty line or after 2-3 lines
-        for (let j = 0; j < contentLines.length; j++) {
-          const cl = contentLines[j];
-          if (!cl.trim() && summaryLines.length > 0) {
-            // Empty line after content - stop
-            break;
-          }
-          if (cl.trim()) {
-            summaryLines.push(cl.trim());
-            // Check if next line is empty (end of summary paragraph)
-            if (j + 1 < contentLines.length && !contentLines[j + 1].trim()) {
-              break;
-            }
-            // Or stop after getting a reasonable summary
-            if (summaryLines.join(' ').length > 100) {
-              break;
-            }
-          }
-        }
-
-        currentChapter.summary = summaryLines.join(' ');
+        currentChapter.summary = extractSummary(chapterLines.slice(1)); // Skip header line
         currentChapter.content = chapterLines.join('\n');
         chapters.push(currentChapter);
+      } else {
+        introductionEnd = i;
       }
 
       // Start new chapter
@@ -145,32 +292,288 @@ export function parseChapters(content: string): Chapter[] {
 
   // Save last chapter
   if (currentChapter) {
-    // Extract summary
-    const contentLines = chapterLines.slice(1);
-    const summaryLines: string[] = [];
+    currentChapter.summary = extractSummary(chapterLines.slice(1));
+    currentChapter.content = chapterLines.join('\n');
+    chapters.push(currentChapter);
+  }
 
-    for (let j = 0; j < contentLines.length; j++) {
-      const cl = contentLines[j];
-      if (!cl.trim() && summaryLines.length > 0) {
-        break;
-      }
-      if (cl.trim()) {
-        summaryLines.push(cl.trim());
-        if (j + 1 < contentLines.length && !contentLines[j + 1].trim()) {
-          break;
-        }
-        if (summaryLines.join(' ').length > 100) {
-          break;
-        }
-      }
+  return { introduction: lines.slice(0, introductionEnd).join('\n'), chapters };
+}
+
+/**
+ * Parse markdown content into chapters based on headers.
+ */
+export function parseChapters(content: string): Chapter[] {
+  return parseSections(content).chapters;
+}
+
+export interface ParsedDocument {
+  metadata: DocumentMetadata;
+  body: string;
+  introduction: string;
+  chapters: Chapter[];
+  // Built on first search and kept with the cached parse until the search
+  // index budget needs the room
+  searchIndex?: DocumentSearchIndex;
+}
+
+interface CacheEntry<T> {
+  mtimeNs: bigint;
+  size: bigint;
+  value: T;
+}
+
+// Cached values keyed by absolute path, in least-recently-used order
+const DOCUMENT_CACHE_SIZE = 1024;
+const parsedDocumentCache = new Map<string, CacheEntry<ParsedDocument>>();
+// Frontmatter read on its own for documents only listed, null when it is
+// not valid YAML
+const documentMetadataCache = new Map<string, CacheEntry<DocumentMetadata | null>>();
+
+function getCachedEntry<T>(
+  cache: Map<string, CacheEntry<T>>,
+  key: string,
+  stats: BigIntStats,
+  onEvict?: (value: T) => void
+): T | undefined {
+  const cached = cache.get(key);
+  if (!cached) {
+    return undefined;
+  }
+  if (cached.mtimeNs !== stats.mtimeNs || cached.size !== stats.size) {
+    cache.delete(key);
+    onEvict?.(cached.value);
+    return undefined;
+  }
+  // Re-insert to mark as most recently used
+  cache.delete(key);
+  cache.set(key, cached);
+  return cached.value;
+}
+
+function setCachedEntry<T>(
+  cache: Map<string, CacheEntry<T>>,
+  key: string,
+  stats: BigIntStats,
+  value: T,
+  onEvict?: (value: T) => void
+): void {
+  const previous = cache.get(key);
+  cache.set(key, { mtimeNs: stats.mtimeNs, size: stats.size, value });
+  if (previous && previous.value !== value) {
+    onEvict?.(previous.value);
+  }
+  if (cache.size > DOCUMENT_CACHE_SIZE) {
+    const oldest = cache.entries().next().value;
+    if (oldest !== undefined) {
+      cache.delete(oldest[0]);
+      onEvict?.(oldest[1].value);
     }
+  }
+}
 
-    currentChapter.summary = summaryLines.join(' ');
-    currentChapter.content = chapterLines.join('\n');
-    chapters.push(currentChapter);
+function parseDocumentContent(content: string): ParsedDocument {
+  const [metadata, body] = parseDocument(content);
+  const { introduction, chapters } = parseSections(body);
+  return { metadata, body, introduction, chapters };
+}
+
+/**
+ * Forget every cached parse of the document at an absolute path.
+ */
+function dropCachedDocument(key: string): void {
+  const cached = parsedDocumentCache.get(key);
+  if (cached) {
+    releaseParsedDocument(cached.value);
+  }
+  parsedDocumentCache.delete(key);
+  documentMetadataCache.delete(key);
+}
+
+/**
+ * Read and parse a document, reusing the cached parse while the file's
+ * mtime and size are unchanged. The result is shared with the cache and
+ * must not be mutated.
+ */
+export function loadParsedDocument(path: string): ParsedDocument {
+  const key = resolve(path);
+  const stats = statSync(key, { bigint: true });
+  const cached = getCachedEntry(parsedDocumentCache, key, stats, releaseParsedDocument);
+  if (cached) {
+    return cached;
+  }
+
+  const parsed = parseDocumentContent(readFileSync(key, 'utf8'));
+  setCachedEntry(parsedDocumentCache, key, stats, parsed, releaseParsedDocument);
+  return parsed;
+}
+
+/**
+ * Async version of loadParsedDocument.
+ */
+export async function loadParsedDocumentAsync(path: string): Promise<ParsedDocument> {
+  const key = resolve(path);
+  const stats = await stat(key, { bigint: true });
+  const cached = getCachedEntry(parsedDocumentCache, key, stats, releaseParsedDocument);
+  if (cached) {
+    return cached;
+  }
+
+  const parsed = parseDocumentContent(await readFile(key, 'utf8'));
+  setCachedEntry(parsedDocumentCache, key, stats, parsed, releaseParsedDocument);
+  return parsed;
+}
+
+// Bytes read per step while looking for the end of the frontmatter
+const METADATA_READ_CHUNK_SIZE = 4096;
+const NON_WHITESPACE = /\S/g;
+
+/**
+ * Metadata of a document from the start of its content, null when its
+ * frontmatter is not valid YAML, or undefined while more content is needed
+ * to tell where the frontmatter ends.
+ */
+function metadataFromPrefix(
+  prefix: string,
+  complete: boolean
+): DocumentMetadata | null | undefined {
+  // The shortest opener, '= yaml =', is eight characters
+  if (!complete && prefix.length < 8) {
+    return undefined;
+  }
+  if (!mayHaveFrontmatter(prefix)) {
+    return {};
+  }
+
+  FRONTMATTER_REGEX.lastIndex = 0;
+  const fmMatch = FRONTMATTER_REGEX.exec(prefix);
+  if (!complete) {
+    if (!fmMatch) {
+      return undefined;
+    }
+    // A closing delimiter followed only by whitespace may still be extended
+    // into a longer match by the content that follows
+    NON_WHITESPACE.lastIndex = fmMatch[0].length;
+    if (!NON_WHITESPACE.test(prefix)) {
+      return undefined;
+    }
+  }
+  if (!fmMatch) {
+    return {};
+  }
+
+  // js-yaml reports malformed input only by throwing
+  try {
+    return parseFrontmatter(fmMatch[3].trim());
+  } catch {
+    return null;
+  }
+}
+
+function isMissingFile(error: unknown): boolean {
+  return (error as NodeJS.ErrnoException).code === 'ENOENT';
+}
+
+/**
+ * Read only as much of a document as needed to parse its frontmatter.
+ * Returns null when the file no longer exists or its frontmatter is not
+ * valid YAML; other I/O errors are thrown. Reuses a cached full parse when
+ * there is one. The result is shared with the cache and must not be mutated.
+ */
+export function readDocumentMetadata(path: string): DocumentMetadata | null {
+  const key = resolve(path);
+  let stats: BigIntStats;
+  let fd: number;
+  try {
+    stats = statSync(key, { bigint: true });
+    const cached =
+      getCachedEntry(parsedDocumentCache, key, stats, releaseParsedDocument)?.metadata ??
+      getCachedEntry(documentMetadataCache, key, stats);
+    if (cached !== undefined) {
+      return cached;
+    }
+    fd = openSync(key, 'r');
+  } catch (error) {
+    if (isMissingFile(error)) {
+      return null;
+    }
+    throw error;
+  }
+
+  let metadata: DocumentMetadata | null | undefined;
+  try {
+    const decoder = new StringDecoder('utf8');
+    const buffer = Buffer.alloc(METADATA_READ_CHUNK_SIZE);
+    let prefix = '';
+    while (metadata === undefined) {
+      const bytesRead = readSync(fd, buffer, 0, buffer.length, null);
+      prefix += bytesRead > 0 ? decoder.write(buffer.subarray(0, bytesRead)) : decoder.end();
+      metadata = metadataFromPrefix(prefix, bytesRead === 0);
+    }
+  } finally {
+    closeSync(fd);
+  }
+
+  setCachedEntry(documentMetadataCache, key, stats, metadata);
+  return metadata;
+}
+
+/**
+ * Async version of readDocumentMetadata.
+ */
+export async function readDocumentMetadataAsync(path: string): Promise<DocumentMetadata | null> {
+  const key = resolve(path);
+  let stats: BigIntStats;
+  let file: FileHandle;
+  try {
+    stats = await stat(key, { bigint: true });
+    const cached =
+      getCachedEntry(parsedDocumentCache, key, stats, releaseParsedDocument)?.metadata ??
+      getCachedEntry(documentMetadataCache, key, stats);
+    if (cached !== undefined) {
+      return cached;
+    }
+    file = await open(key, 'r');
+  } catch (error) {
+    if (isMissingFile(error)) {
+      return null;
+    }
+    throw error;
   }
 
-  return chapters;
+  let metadata: DocumentMetadata | null | undefined;
+  try {
+    const decoder = new StringDecoder('utf8');
+    const buffer = Buffer.alloc(METADATA_READ_CHUNK_SIZE);
+    let prefix = '';
+    while (metadata === undefined) {
+      const { bytesRead } = await file.read(buffer, 0, buffer.length, null);
+      prefix += bytesRead > 0 ? decoder.write(buffer.subarray(0, bytesRead)) : decoder.end();
+      metadata = metadataFromPrefix(prefix, bytesRead === 0);
+    }
+  } finally {
+    await file.close();
+  }
+
+  setCachedEntry(documentMetadataCache, key, stats, metadata);
+  return metadata;
+}
+
+/**
+ * Serialize metadata and body into a markdown document with frontmatter.
+ */
+export function serializeDocument(metadata: object, content: string): string {
+  // noRefs skips js-yaml's scan for repeated objects to emit as anchors
+  return `---\n${yaml.dump(metadata, { noRefs: true })}---\n${content}`;
+}
+
+/**
+ * Unique temp file path in the same directory as the document. The dot
+ * prefix and .tmp suffix keep it out of the *.md listings and match the
+ * storage .gitignore's *.tmp rule, so a commit never picks it up.
+ */
+function documentTempPath(path: string): string {
+  return join(dirname(path), `.${basename(path)}.${randomBytes(8).toString('hex')}.tmp`);
 }
 
 /**
@@ -188,259 +591,590 @@ export function writeDocument(path: string, metadata: DocumentMetadata, content:
   }
 
   // Create document with frontmatter
-  const frontmatter = yaml.dump(metadata);
-  const fullContent = `---\n${frontmatter}---\n${content}`;
+  const fullContent = serializeDocument(metadata, content);
+
+  // Write atomically using a temp file next to the target, so the rename
+  // never crosses filesystems and readers only ever see complete documents
+  const tempFile = documentTempPath(path);
+  try {
+    writeFileSync(tempFile, fullContent, 'utf8');
+    renameSync(tempFile, path);
+  } catch (error) {
+    try {
+      unlinkSync(tempFile);
+    } catch {
+      // Ignore cleanup errors
+    }
+    throw error;
+  }
 
-  // Write atomically using temp file
-  const tempFile = join(tmpdir(), `knowledge-mcp-${randomBytes(8).toString('hex')}.tmp`);
-  writeFileSync(tempFile, fullContent, 'utf8');
+  // Drop any cached parse of the previous content
+  dropCachedDocument(resolve(path));
+}
 
-  // Rename temp file to final location
-  writeFileSync(path, fullContent, 'utf8');
+interface SearchSegment {
+  // Key the segment's matches are grouped under
+  key: string;
+  chapter: string;
+  summary: string;
+  text: string;
+  // Case-folded, NFC-normalized text the keywords are matched against
+  folded: string;
+  // Offset in text of each folded code unit, plus text.length at the end;
+  // null when folding kept every offset in place
+  offsets: number[] | null;
 }
 
+interface DocumentSearchIndex {
+  segments: SearchSegment[];
+  // Every three-character window of the folded segments
+  trigrams: Set<number>;
+}
+
+// Folds String.prototype.toLowerCase() leaves distinct from their lowercase form
+const CASE_FOLD_EXTRAS = /[ßςſ]/g;
+const CASE_FOLD_MAP: Record<string, string> = { ß: 'ss', ς: 'σ', ſ: 's' };
+
+const ASCII_ONLY = /^[\x00-\x7f]*$/;
+
+// A base character with the combining marks following it
+const CHARACTER_CLUSTER = /\P{M}\p{M}*|\p{M}+/gu;
+
 /**
- * Search knowledge documents for a query.
+ * NFC-normalize and case-fold text for caseless matching.
  */
-export function searchDocuments(projectPath: string, query: string): SearchResult[] {
-  if (!query) {
-    return [];
+function foldCase(text: string): string {
+  return text
+    .normalize('NFC')
+    .toLowerCase()
+    .replace(CASE_FOLD_EXTRAS, (char) => CASE_FOLD_MAP[char]);
+}
+
+/**
+ * Fold a segment's text once, keeping a map from folded offsets back to
+ * the original text when folding changes any lengths.
+ */
+function foldSegmentText(text: string): Pick<SearchSegment, 'folded' | 'offsets'> {
+  if (ASCII_ONLY.test(text)) {
+    return { folded: text.toLowerCase(), offsets: null };
   }
 
-  const knowledgeDir = join(projectPath, 'knowledge');
-  if (!existsSync(knowledgeDir)) {
-    return [];
+  const parts: string[] = [];
+  const offsets: number[] = [];
+  let shifted = false;
+  for (const match of text.matchAll(CHARACTER_CLUSTER)) {
+    const cluster = foldCase(match[0]);
+    shifted ||= cluster.length !== match[0].length;
+    for (let i = 0; i < cluster.length; i++) {
+      offsets.push(match.index);
+    }
+    parts.push(cluster);
   }
+  offsets.push(text.length);
 
-  // Split query into individual keywords
-  const keywords = query
+  return { folded: parts.join(''), offsets: shifted ? offsets : null };
+}
+
+/**
+ * Pack the three UTF-16 code units starting at index into one number.
+ */
+function trigramAt(text: string, index: number): number {
+  return (
+    text.charCodeAt(index) * 0x100000000 +
+    text.charCodeAt(index + 1) * 0x10000 +
+    text.charCodeAt(index + 2)
+  );
+}
+
+/**
+ * Build the searchable segments of a document and their trigram index.
+ * Without chapters the whole body is one segment; otherwise each chapter
+ * is a segment, followed by the content before the first chapter.
+ */
+function buildSearchIndex(document: ParsedDocument): DocumentSearchIndex {
+  const { body, introduction, chapters } = document;
+  const segments: SearchSegment[] = [];
+
+  if (chapters.length === 0) {
+    // Body-level matches are reported as a special chapter
+    segments.push({
+      key: '_document_body',
+      chapter: '',
+      summary: '',
+      text: body,
+      ...foldSegmentText(body),
+    });
+  } else {
+    for (const chapter of chapters) {
+      segments.push({
+        key: chapter.title,
+        chapter: chapter.title,
+        summary: chapter.summary,
+        text: chapter.content,
+        ...foldSegmentText(chapter.content),
+      });
+    }
+
+    // Content before the first chapter
+    if (introduction) {
+      segments.push({
+        key: '_pre_chapter',
+        chapter: '',
+        summary: '',
+        text: introduction,
+        ...foldSegmentText(introduction),
+      });
+    }
+  }
+
+  const trigrams = new Set<number>();
+  for (const segment of segments) {
+    for (let i = 0; i + 2 < segment.folded.length; i++) {
+      trigrams.add(trigramAt(segment.folded, i));
+    }
+  }
+
+  return { segments, trigrams };
+}
+
+// Search indexes can outweigh the text they are built from, so they are kept
+// only for the most recently searched documents, up to an estimated total
+// size; a document whose index was dropped rebuilds it on its next search
+const SEARCH_INDEX_BUDGET_BYTES = 64 * 1024 * 1024;
+// Rough cost of one set entry: hash table slot plus the boxed number
+const TRIGRAM_ENTRY_BYTES = 32;
+// Documents holding a search index and its estimated size, in
+// least-recently-used order
+const indexedDocuments = new Map<ParsedDocument, number>();
+let indexedBytes = 0;
+// Parses no longer in the cache; searches still running on them build
+// throwaway indexes instead of registering new ones
+const releasedDocuments = new WeakSet<ParsedDocument>();
+
+function estimateSearchIndexBytes(searchIndex: DocumentSearchIndex): number {
+  let bytes = searchIndex.trigrams.size * TRIGRAM_ENTRY_BYTES;
+  for (const segment of searchIndex.segments) {
+    // UTF-16 text and folded text, plus eight bytes per offset
+    bytes += (segment.text.length + segment.folded.length) * 2;
+    bytes += (segment.offsets?.length ?? 0) * 8;
+  }
+  return bytes;
+}
+
+/**
+ * Drop the search index of a parse that left the cache, so stale and
+ * evicted parses neither stay reachable nor count against the budget.
+ */
+function releaseParsedDocument(document: ParsedDocument): void {
+  releasedDocuments.add(document);
+  forgetSearchIndex(document);
+}
+
+function forgetSearchIndex(document: ParsedDocument): void {
+  const bytes = indexedDocuments.get(document);
+  if (bytes !== undefined) {
+    indexedDocuments.delete(document);
+    indexedBytes -= bytes;
+  }
+  document.searchIndex = undefined;
+}
+
+/**
+ * Search index of a document, built if it has none, dropping the indexes
+ * of the least recently searched documents while over the budget.
+ */
+function getSearchIndex(document: ParsedDocument): DocumentSearchIndex {
+  const bytes = indexedDocuments.get(document);
+  if (document.searchIndex && bytes !== undefined) {
+    // Re-insert to mark as most recently used
+    indexedDocuments.delete(document);
+    indexedDocuments.set(document, bytes);
+    return document.searchIndex;
+  }
+
+  const searchIndex = buildSearchIndex(document);
+  if (releasedDocuments.has(document)) {
+    return searchIndex;
+  }
+  const searchIndexBytes = estimateSearchIndexBytes(searchIndex);
+  document.searchIndex = searchIndex;
+  indexedDocuments.set(document, searchIndexBytes);
+  indexedBytes += searchIndexBytes;
+
+  // The index just built is kept even when it alone exceeds the budget
+  for (const oldest of indexedDocuments.keys()) {
+    if (indexedBytes <= SEARCH_INDEX_BUDGET_BYTES || oldest === document) {
+      break;
+    }
+    forgetSearchIndex(oldest);
+  }
+  return searchIndex;
+}
+
+/**
+ * Check the trigram index for a keyword. A false result means the keyword
+ * cannot occur in any segment; keywords shorter than three characters
+ * always have to be scanned for.
+ */
+function mayContainKeyword(searchIndex: DocumentSearchIndex, keyword: string): boolean {
+  for (let i = 0; i + 2 < keyword.length; i++) {
+    if (!searchIndex.trigrams.has(trigramAt(keyword, i))) {
+      return false;
+    }
+  }
+  return true;
+}
+
+interface ChapterMatch {
+  chapter: string;
+  keywords_found: Set<string>;
+  match_context: Record<string, string[]>;
+  chapter_summary: string;
+}
+
+interface SearchKeyword {
+  // Lowercased query token that results are reported under
+  term: string;
+  // Case-folded form matched against the folded text
+  folded: string;
+}
+
+/**
+ * Split a search query into keywords.
+ */
+function parseSearchKeywords(query: string): SearchKeyword[] {
+  return query
     .split(/\s+/)
     .map((kw) => kw.trim().toLowerCase())
-    .filter((kw) => kw);
+    .filter((kw) => kw)
+    .map((term) => ({ term, folded: foldCase(term) }));
+}
 
-  if (keywords.length === 0) {
-    return [];
-  }
-
-  // Structure to aggregate results by document
-  const documentResults: Record<
-    string,
-    {
-      metadata: DocumentMetadata;
-      matching_chapters: Record<
-        string,
-        {
-          chapter: string;
-          keywords_found: Set<string>;
-          match_context: Record<string, string[]>;
-          chapter_summary: string;
+// Matches exactly the characters String.prototype.trim() removes
+const TRIMMABLE_CHAR = /\s/;
+
+/**
+ * Build the context string shown for a match at index.
+ */
+function matchContext(text: string, index: number, length: number): string {
+  const ctxStart = Math.max(0, index - 50);
+  const ctxEnd = Math.min(text.length, index + length + 50);
+
+  // Trim the window in place so only the final context string is allocated
+  let start = ctxStart;
+  let end = ctxEnd;
+  while (start < end && TRIMMABLE_CHAR.test(text[start])) start++;
+  while (end > start && TRIMMABLE_CHAR.test(text[end - 1])) end--;
+
+  const prefix = ctxStart > 0 ? '...' : '';
+  const suffix = ctxEnd < text.length ? '...' : '';
+  return prefix + text.slice(start, end) + suffix;
+}
+
+/**
+ * Build the context for a match found at a folded offset of a segment.
+ */
+function segmentContext(segment: SearchSegment, start: number, length: number): string {
+  const { offsets } = segment;
+  if (!offsets) {
+    return matchContext(segment.text, start, length);
+  }
+  return matchContext(segment.text, offsets[start], offsets[start + length] - offsets[start]);
+}
+
+// Below this many distinct keywords, per-keyword indexOf scans beat the automaton
+const AHO_CORASICK_MIN_KEYWORDS = 16;
+
+// Code units below this get a dense transition table; the rest use maps
+const DENSE_ALPHABET = 128;
+
+/**
+ * Finds every occurrence of a set of keywords, including overlapping ones.
+ * Large keyword sets are matched in a single Aho-Corasick pass over the text
+ * instead of one scan per keyword.
+ */
+class KeywordMatcher {
+  // Distinct keywords; hit lists are indexed like this array
+  readonly keywords: string[];
+  private readonly positions = new Map<string, number>();
+
+  // Aho-Corasick automaton, only built for large keyword sets.
+  // ASCII transitions are fully resolved into a dense table; other code
+  // units follow trie edges and failure links.
+  private dense: Int32Array | null = null;
+  private readonly edges: Map<number, number>[] = [];
+  private readonly failure: number[] = [];
+  private readonly outputs: number[][] = [];
+
+  constructor(keywords: string[]) {
+    this.keywords = Array.from(new Set(keywords));
+    this.keywords.forEach((keyword, k) => this.positions.set(keyword, k));
+
+    if (this.keywords.length >= AHO_CORASICK_MIN_KEYWORDS) {
+      this.buildAutomaton();
+    }
+  }
+
+  indexOf(keyword: string): number {
+    return this.positions.get(keyword) ?? -1;
+  }
+
+  /**
+   * Find the start offset of every keyword occurrence in text.
+   * Keywords whose candidates entry is false are known to be absent.
+   */
+  findAll(text: string, candidates: boolean[]): number[][] {
+    const hits = this.keywords.map((): number[] => []);
+
+    const dense = this.dense;
+    if (!dense) {
+      for (let k = 0; k < this.keywords.length; k++) {
+        if (!candidates[k]) {
+          continue;
+        }
+        let index = text.indexOf(this.keywords[k]);
+        while (index !== -1) {
+          hits[k].push(index);
+          index = text.indexOf(this.keywords[k], index + 1);
         }
-      >;
+      }
+      return hits;
     }
-  > = {};
 
-  // Search through all markdown files
-  const mdFiles = readdirSync(knowledgeDir).filter((f) => f.endsWith('.md'));
+    const { edges, failure, outputs, keywords } = this;
+    const length = text.length;
+    let state = 0;
+    for (let i = 0; i < length; i++) {
+      const code = text.charCodeAt(i);
+      if (code < DENSE_ALPHABET) {
+        state = dense[state * DENSE_ALPHABET + code];
+      } else {
+        let next = edges[state].get(code);
+        while (next === undefined && state !== 0) {
+          state = failure[state];
+          next = edges[state].get(code);
+        }
+        state = next ?? 0;
+      }
 
-  for (const mdFile of mdFiles) {
-    try {
-      const filePath = join(knowledgeDir, mdFile);
-      const content = readFileSync(filePath, 'utf8');
-
-      // Parse document
-      const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
-
-      // Search each keyword
-      for (const keyword of keywords) {
-        const bodyLower = body.toLowerCase();
-
-        // If no chapters, search entire body
-        if (chapters.length === 0 && bodyLower.includes(keyword)) {
-          const contexts: string[] = [];
-          let startPos = 0;
-
-          let index = bodyLower.indexOf(keyword, startPos);
-          while (index !== -1) {
-            // Extract context
-            const ctxStart = Math.max(0, index - 50);
-            const ctxEnd = Math.min(body.length, index + keyword.length + 50);
-            let context = body.slice(ctxStart, ctxEnd).trim();
-
-            if (ctxStart > 0) context = '...' + context;
-            if (ctxEnd < body.length) context = context + '...';
-
-            contexts.push(context);
-            startPos = index + 1;
-            index = bodyLower.indexOf(keyword, startPos);
-          }
-
-          if (contexts.length > 0) {
-            // Initialize document entry if needed
-            if (!(mdFile in documentResults)) {
-              documentResults[mdFile] = {
-                metadata,
-                matching_chapters: {},
-              };
-            }
-
-            // Add body-level match as a special chapter
-            if (!('_document_body' in documentResults[mdFile].matching_chapters)) {
-              documentResults[mdFile].matching_chapters['_document_body'] = {
-                chapter: '',
-                keywords_found: new Set(),
-                match_context: {},
-                chapter_summary: '',
-              };
-            }
-
-            const chapterData = documentResults[mdFile].matching_chapters['_document_body'];
-            chapterData.keywords_found.add(keyword);
-            if (!(keyword in chapterData.match_context)) {
-              chapterData.match_context[keyword] = [];
-            }
-            chapterData.match_context[keyword].push(...contexts);
-          }
+      const output = outputs[state];
+      for (let o = 0; o < output.length; o++) {
+        hits[output[o]].push(i - keywords[output[o]].length + 1);
+      }
+    }
+
+    return hits;
+  }
+
+  private addState(): number {
+    this.edges.push(new Map());
+    this.failure.push(0);
+    this.outputs.push([]);
+    return this.edges.length - 1;
+  }
+
+  private buildAutomaton(): void {
+    this.addState();
+
+    // Trie of all keywords
+    this.keywords.forEach((keyword, k) => {
+      let state = 0;
+      for (let i = 0; i < keyword.length; i++) {
+        const code = keyword.charCodeAt(i);
+        let next = this.edges[state].get(code);
+        if (next === undefined) {
+          next = this.addState();
+          this.edges[state].set(code, next);
         }
+        state = next;
+      }
+      this.outputs[state].push(k);
+    });
+
+    const dense = new Int32Array(this.edges.length * DENSE_ALPHABET);
+    for (const [code, next] of this.edges[0]) {
+      if (code < DENSE_ALPHABET) {
+        dense[code] = next;
+      }
+    }
+
+    // Breadth-first pass linking each state to its longest proper suffix
+    // state, which is always resolved before the state itself
+    const queue = Array.from(this.edges[0].values());
+    for (let head = 0; head < queue.length; head++) {
+      const state = queue[head];
+      const fail = this.failure[state];
 
-        // Search in chapters
-        for (const chapter of chapters) {
-          if (chapter.content.toLowerCase().includes(keyword)) {
-            const contexts: string[] = [];
-            const chapterLower = chapter.content.toLowerCase();
-            let startPos = 0;
-
-            let index = chapterLower.indexOf(keyword, startPos);
-            while (index !== -1) {
-              // Extract context
-              const ctxStart = Math.max(0, index - 50);
-              const ctxEnd = Math.min(chapter.content.length, index + keyword.length + 50);
-              let context = chapter.content.slice(ctxStart, ctxEnd).trim();
-
-              if (ctxStart > 0) context = '...' + context;
-              if (ctxEnd < chapter.content.length) context = context + '...';
-
-              contexts.push(context);
-              startPos = index + 1;
-              index = chapterLower.indexOf(keyword, startPos);
-            }
-
-            if (contexts.length > 0) {
-              // Initialize document entry if needed
-              if (!(mdFile in documentResults)) {
-                documentResults[mdFile] = {
-                  metadata,
-                  matching_chapters: {},
-                };
-              }
-
-              // Initialize chapter entry if needed
-              if (!(chapter.title in documentResults[mdFile].matching_chapters)) {
-                documentResults[mdFile].matching_chapters[chapter.title] = {
-                  chapter: chapter.title,
-                  keywords_found: new Set(),
-                  match_context: {},
-                  chapter_summary: chapter.summary,
-                };
-              }
-
-              const chapterData = documentResults[mdFile].matching_chapters[chapter.title];
-              chapterData.keywords_found.add(keyword);
-              if (!(keyword in chapterData.match_context)) {
-                chapterData.match_context[keyword] = [];
-              }
-              chapterData.match_context[keyword].push(...contexts);
-            }
-          }
+      // Missing ASCII transitions behave like those of the failure state
+      dense.copyWithin(state * DENSE_ALPHABET, fail * DENSE_ALPHABET, (fail + 1) * DENSE_ALPHABET);
+
+      for (const [code, next] of this.edges[state]) {
+        let fallback = fail;
+        while (fallback !== 0 && !this.edges[fallback].has(code)) {
+          fallback = this.failure[fallback];
         }
+        this.failure[next] = this.edges[fallback].get(code) ?? 0;
+        this.outputs[next] = this.outputs[next].concat(this.outputs[this.failure[next]]);
 
-        // If chapters exist, also search for pre-chapter content
-        if (chapters.length > 0 && bodyLower.includes(keyword)) {
-          // Get the content before the first chapter
-          const firstChapterStart = body.indexOf('\n##');
-          if (firstChapterStart > 0) {
-            const preChapterContent = body.slice(0, firstChapterStart);
-            if (preChapterContent.toLowerCase().includes(keyword)) {
-              const contexts: string[] = [];
-              const contentLower = preChapterContent.toLowerCase();
-              let startPos = 0;
-
-              let index = contentLower.indexOf(keyword, startPos);
-              while (index !== -1) {
-                // Extract context
-                const ctxStart = Math.max(0, index - 50);
-                const ctxEnd = Math.min(preChapterContent.length, index + keyword.length + 50);
-                let context = preChapterContent.slice(ctxStart, ctxEnd).trim();
-
-                if (ctxStart > 0) context = '...' + context;
-                if (ctxEnd < preChapterContent.length) context = context + '...';
-
-                contexts.push(context);
-                startPos = index + 1;
-                index = contentLower.indexOf(keyword, startPos);
-              }
-
-              if (contexts.length > 0) {
-                // Initialize document entry if needed
-                if (!(mdFile in documentResults)) {
-                  documentResults[mdFile] = {
-                    metadata,
-                    matching_chapters: {},
-                  };
-                }
-
-                // Add pre-chapter content as a special chapter
-                if (!('_pre_chapter' in documentResults[mdFile].matching_chapters)) {
-                  documentResults[mdFile].matching_chapters['_pre_chapter'] = {
-                    chapter: '',
-                    keywords_found: new Set(),
-                    match_context: {},
-                    chapter_summary: '',
-                  };
-                }
-
-                const chapterData = documentResults[mdFile].matching_chapters['_pre_chapter'];
-                chapterData.keywords_found.add(keyword);
-                if (!(keyword in chapterData.match_context)) {
-                  chapterData.match_context[keyword] = [];
-                }
-                chapterData.match_context[keyword].push(...contexts);
-              }
-            }
-          }
+        if (code < DENSE_ALPHABET) {
+          dense[state * DENSE_ALPHABET + code] = next;
         }
+        queue.push(next);
       }
-    } catch {
-      // Skip files that can't be read
-      continue;
     }
+
+    this.dense = dense;
   }
+}
 
-  // Convert to document-centric format
-  const results: SearchResult[] = [];
+/**
+ * Record the contexts found for a keyword under the given chapter key.
+ */
+function addChapterMatch(
+  matchingChapters: Record<string, ChapterMatch>,
+  key: string,
+  chapter: string,
+  summary: string,
+  keyword: string,
+  contexts: string[]
+): void {
+  if (!(key in matchingChapters)) {
+    matchingChapters[key] = {
+      chapter,
+      keywords_found: new Set(),
+      match_context: {},
+      chapter_summary: summary,
+    };
+  }
 
-  for (const [filename, docData] of Object.entries(documentResults)) {
-    // Convert matching chapters to array
-    const matchingChapters: MatchingChapter[] = [];
+  const chapterData = matchingChapters[key];
+  chapterData.keywords_found.add(keyword);
+  if (!(keyword in chapterData.match_context)) {
+    chapterData.match_context[keyword] = [];
+  }
+  chapterData.match_context[keyword].push(...contexts);
+}
 
-    for (const [, chapterData] of Object.entries(docData.matching_chapters)) {
-      matchingChapters.push({
-        chapter: chapterData.chapter,
-        keywords_found: Array.from(chapterData.keywords_found).sort(),
-        match_context: chapterData.match_context,
-        chapter_summary: chapterData.chapter_summary,
-      });
-    }
+/**
+ * Search a single document for all keywords.
+ * Returns null when no keyword matches.
+ */
+function searchDocumentContent(
+  file: string,
+  document: ParsedDocument,
+  keywords: SearchKeyword[],
+  matcher: KeywordMatcher
+): SearchResult | null {
+  const searchIndex = getSearchIndex(document);
+
+  const candidates = matcher.keywords.map((keyword) => mayContainKeyword(searchIndex, keyword));
+  if (!candidates.includes(true)) {
+    return null;
+  }
 
-    results.push({
-      file: filename,
-      match_count: matchingChapters.length,
-      metadata: docData.metadata,
-      matching_chapters: matchingChapters,
+  const segmentHits = searchIndex.segments.map((segment) =>
+    matcher.findAll(segment.folded, candidates)
+  );
+
+  // Group keyword by keyword, so chapters are listed in the same order as
+  // a separate scan per keyword would find them
+  const matchingChapters: Record<string, ChapterMatch> = {};
+
+  for (const { term, folded } of keywords) {
+    const k = matcher.indexOf(folded);
+
+    searchIndex.segments.forEach((segment, s) => {
+      const starts = segmentHits[s][k];
+      if (starts.length > 0) {
+        addChapterMatch(
+          matchingChapters,
+          segment.key,
+          segment.chapter,
+          segment.summary,
+          term,
+          starts.map((start) => segmentContext(segment, start, folded.length))
+        );
+      }
     });
   }
 
-  return results;
+  // Convert matching chapters to array
+  const matchingChapterList: MatchingChapter[] = Object.values(matchingChapters).map(
+    (chapterData) => ({
+      chapter: chapterData.chapter,
+      keywords_found: Array.from(chapterData.keywords_found).sort(),
+      match_context: chapterData.match_context,
+      chapter_summary: chapterData.chapter_summary,
+    })
+  );
+
+  if (matchingChapterList.length === 0) {
+    return null;
+  }
+
+  return {
+    file,
+    match_count: matchingChapterList.length,
+    metadata: document.metadata,
+    matching_chapters: matchingChapterList,
+  };
+}
+
+/**
+ * Search knowledge documents for a query, yielding each matching document
+ * as soon as it has been searched.
+ */
+export function* iterateSearchResults(projectPath: string, query: string): Generator<SearchResult> {
+  if (!query) {
+    return;
+  }
+
+  const knowledgeDir = join(projectPath, 'knowledge');
+
+  // Split query into individual keywords
+  const keywords = parseSearchKeywords(query);
+
+  if (keywords.length === 0) {
+    return;
+  }
+
+  // Built once per query and shared by every document
+  const matcher = new KeywordMatcher(keywords.map((keyword) => keyword.folded));
+
+  // Search through all markdown files; a project without knowledge files
+  // has no knowledge directory, which needs no separate existence check
+  let files: string[];
+  try {
+    files = readdirSync(knowledgeDir);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+      return;
+    }
+    throw error;
+  }
+  const mdFiles = files.filter((f) => f.endsWith('.md'));
+
+  for (const mdFile of mdFiles) {
+    let document: ParsedDocument;
+    try {
+      document = loadParsedDocument(join(knowledgeDir, mdFile));
+    } catch {
+      // Skip files that can't be read
+      continue;
+    }
+
+    const result = searchDocumentContent(mdFile, document, keywords, matcher);
+    if (result) {
+      yield result;
+    }
+  }
+}
+
+/**
+ * Search knowledge documents for a query.
+ */
+export function searchDocuments(projectPath: string, query: string): SearchResult[] {
+  return Array.from(iterateSearchResults(projectPath, query));
 }
 
 // ============================================
@@ -469,264 +1203,90 @@ export async function writeDocumentAsync(
   }
 
   // Create document with frontmatter
-  const frontmatter = yaml.dump(metadata);
-  const fullContent = `---\n${frontmatter}---\n${content}`;
+  const fullContent = serializeDocument(metadata, content);
 
-  // Write atomically using temp file
-  const tempFile = join(tmpdir(), `knowledge-mcp-${randomBytes(8).toString('hex')}.tmp`);
-  await writeFile(tempFile, fullContent, 'utf8');
+  // Write atomically using a temp file next to the target
+  const tempFile = documentTempPath(path);
+  try {
+    await writeFile(tempFile, fullContent, 'utf8');
+    await rename(tempFile, path);
+  } catch (error) {
+    try {
+      await unlink(tempFile);
+    } catch {
+      // Ignore cleanup errors
+    }
+    throw error;
+  }
 
-  // Move temp file to final location
-  await writeFile(path, fullContent, 'utf8');
+  // Drop any cached parse of the previous content
+  dropCachedDocument(resolve(path));
 }
 
 /**
- * Async version of searchDocuments.
- * Search knowledge documents for a query.
+ * Async version of iterateSearchResults.
+ * Files are read concurrently, results are yielded in directory order.
  */
-export async function searchDocumentsAsync(
+export async function* iterateSearchResultsAsync(
   projectPath: string,
   query: string
-): Promise<SearchResult[]> {
+): AsyncGenerator<SearchResult> {
   if (!query) {
-    return [];
+    return;
   }
 
   const knowledgeDir = join(projectPath, 'knowledge');
-  try {
-    await access(knowledgeDir);
-  } catch {
-    return [];
-  }
 
   // Split query into individual keywords
-  const keywords = query
-    .split(/\s+/)
-    .map((kw) => kw.trim().toLowerCase())
-    .filter((kw) => kw);
+  const keywords = parseSearchKeywords(query);
 
   if (keywords.length === 0) {
-    return [];
-  }
-
-  // Structure to aggregate results by document
-  const documentResults: Record<
-    string,
-    {
-      metadata: DocumentMetadata;
-      matching_chapters: Record<
-        string,
-        {
-          chapter: string;
-          keywords_found: Set<string>;
-          match_context: Record<string, string[]>;
-          chapter_summary: string;
-        }
-      >;
-    }
-  > = {};
-
-  // Search through all markdown files
-  const files = await readdir(knowledgeDir);
-  const mdFiles = files.filter((f) => f.endsWith('.md'));
-
-  for (const mdFile of mdFiles) {
-    try {
-      const filePath = join(knowledgeDir, mdFile);
-      const content = await readFile(filePath, 'utf8');
-
-      // Parse document
-      const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
-
-      // Search each keyword
-      for (const keyword of keywords) {
-        const bodyLower = body.toLowerCase();
-
-        // If no chapters, search entire body
-        if (chapters.length === 0 && bodyLower.includes(keyword)) {
-          const contexts: string[] = [];
-          let startPos = 0;
-
-          let index = bodyLower.indexOf(keyword, startPos);
-          while (index !== -1) {
-            // Extract context
-            const ctxStart = Math.max(0, index - 50);
-            const ctxEnd = Math.min(body.length, index + keyword.length + 50);
-            let context = body.slice(ctxStart, ctxEnd).trim();
-
-            if (ctxStart > 0) context = '...' + context;
-            if (ctxEnd < body.length) context = context + '...';
-
-            contexts.push(context);
-            startPos = index + 1;
-            index = bodyLower.indexOf(keyword, startPos);
-          }
-
-          if (contexts.length > 0) {
-            // Initialize document entry if needed
-            if (!(mdFile in documentResults)) {
-              documentResults[mdFile] = {
-                metadata,
-                matching_chapters: {},
-              };
-            }
-
-            // Add body-level match as a special chapter
-            if (!('_document_body' in documentResults[mdFile].matching_chapters)) {
-              documentResults[mdFile].matching_chapters['_document_body'] = {
-                chapter: '',
-                keywords_found: new Set(),
-                match_context: {},
-                chapter_summary: '',
-              };
-            }
-
-            const chapterData = documentResults[mdFile].matching_chapters['_document_body'];
-            chapterData.keywords_found.add(keyword);
-            if (!(keyword in chapterData.match_context)) {
-              chapterData.match_context[keyword] = [];
-            }
-            chapterData.match_context[keyword].push(...contexts);
-          }
-        }
+    return;
+  }
 
-        // Search in chapters
-        for (const chapter of chapters) {
-          if (chapter.content.toLowerCase().includes(keyword)) {
-            const contexts: string[] = [];
-            const chapterLower = chapter.content.toLowerCase();
-            let startPos = 0;
-
-            let index = chapterLower.indexOf(keyword, startPos);
-            while (index !== -1) {
-              // Extract context
-              const ctxStart = Math.max(0, index - 50);
-              const ctxEnd = Math.min(chapter.content.length, index + keyword.length + 50);
-              let context = chapter.content.slice(ctxStart, ctxEnd).trim();
-
-              if (ctxStart > 0) context = '...' + context;
-              if (ctxEnd < chapter.content.length) context = context + '...';
-
-              contexts.push(context);
-              startPos = index + 1;
-              index = chapterLower.indexOf(keyword, startPos);
-            }
-
-            if (contexts.length > 0) {
-              // Initialize document entry if needed
-              if (!(mdFile in documentResults)) {
-                documentResults[mdFile] = {
-                  metadata,
-                  matching_chapters: {},
-                };
-              }
-
-              // Initialize chapter entry if needed
-              if (!(chapter.title in documentResults[mdFile].matching_chapters)) {
-                documentResults[mdFile].matching_chapters[chapter.title] = {
-                  chapter: chapter.title,
-                  keywords_found: new Set(),
-                  match_context: {},
-                  chapter_summary: chapter.summary,
-                };
-              }
-
-              const chapterData = documentResults[mdFile].matching_chapters[chapter.title];
-              chapterData.keywords_found.add(keyword);
-              if (!(keyword in chapterData.match_context)) {
-                chapterData.match_context[keyword] = [];
-              }
-              chapterData.match_context[keyword].push(...contexts);
-            }
-          }
-        }
+  // Built once per query and shared by every document
+  const matcher = new KeywordMatcher(keywords.map((keyword) => keyword.folded));
 
-        // If chapters exist, also search for pre-chapter content
-        if (chapters.length > 0 && bodyLower.includes(keyword)) {
-          // Get the content before the first chapter
-          const firstChapterStart = body.indexOf('\n##');
-          if (firstChapterStart > 0) {
-            const preChapterContent = body.slice(0, firstChapterStart);
-            if (preChapterContent.toLowerCase().includes(keyword)) {
-              const contexts: string[] = [];
-              const contentLower = preChapterContent.toLowerCase();
-              let startPos = 0;
-
-              let index = contentLower.indexOf(keyword, startPos);
-              while (index !== -1) {
-                // Extract context
-                const ctxStart = Math.max(0, index - 50);
-                const ctxEnd = Math.min(preChapterContent.length, index + keyword.length + 50);
-                let context = preChapterContent.slice(ctxStart, ctxEnd).trim();
-
-                if (ctxStart > 0) context = '...' + context;
-                if (ctxEnd < preChapterContent.length) context = context + '...';
-
-                contexts.push(context);
-                startPos = index + 1;
-                index = contentLower.indexOf(keyword, startPos);
-              }
-
-              if (contexts.length > 0) {
-                // Initialize document entry if needed
-                if (!(mdFile in documentResults)) {
-                  documentResults[mdFile] = {
-                    metadata,
-                    matching_chapters: {},
-                  };
-                }
-
-                // Add pre-chapter content as a special chapter
-                if (!('_pre_chapter' in documentResults[mdFile].matching_chapters)) {
-                  documentResults[mdFile].matching_chapters['_pre_chapter'] = {
-                    chapter: '',
-                    keywords_found: new Set(),
-                    match_context: {},
-                    chapter_summary: '',
-                  };
-                }
-
-                const chapterData = documentResults[mdFile].matching_chapters['_pre_chapter'];
-                chapterData.keywords_found.add(keyword);
-                if (!(keyword in chapterData.match_context)) {
-                  chapterData.match_context[keyword] = [];
-                }
-                chapterData.match_context[keyword].push(...contexts);
-              }
-            }
-          }
-        }
-      }
-    } catch {
-      // Skip files that can't be read
-      continue;
+  // Start reading and parsing all markdown files concurrently
+  let files: string[];
+  try {
+    files = await readdir(knowledgeDir);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+      return;
     }
+    throw error;
   }
-
-  // Convert to document-centric format
-  const results: SearchResult[] = [];
-
-  for (const [filename, docData] of Object.entries(documentResults)) {
-    // Convert matching chapters to array
-    const matchingChapters: MatchingChapter[] = [];
-
-    for (const [, chapterData] of Object.entries(docData.matching_chapters)) {
-      matchingChapters.push({
-        chapter: chapterData.chapter,
-        keywords_found: Array.from(chapterData.keywords_found).sort(),
-        match_context: chapterData.match_context,
-        chapter_summary: chapterData.chapter_summary,
-      });
+  const mdFiles = files.filter((f) => f.endsWith('.md'));
+  const documents = mdFiles.map((mdFile) =>
+    // Skip files that can't be read
+    loadParsedDocumentAsync(join(knowledgeDir, mdFile)).catch(() => null)
+  );
+
+  for (let i = 0; i < mdFiles.length; i++) {
+    const document = await documents[i];
+    if (!document) {
+      continue;
     }
 
-    results.push({
-      file: filename,
-      match_count: matchingChapters.length,
-      metadata: docData.metadata,
-      matching_chapters: matchingChapters,
-    });
+    const result = searchDocumentContent(mdFiles[i], document, keywords, matcher);
+    if (result) {
+      yield result;
+    }
   }
+}
 
+/**
+ * Async version of searchDocuments.
+ * Search knowledge documents for a query.
+ */
+export async function searchDocumentsAsync(
+  projectPath: string,
+  query: string
+): Promise<SearchResult[]> {
+  const results: SearchResult[] = [];
+  for await (const result of iterateSearchResultsAsync(projectPath, query)) {
+    results.push(result);
+  }
   return results;
 }
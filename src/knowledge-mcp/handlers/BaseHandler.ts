@@ -104,10 +104,14 @@ export abstract class BaseHandler {
   }
 
   /**
-   * Format successful response
+   * Format successful response.
+   *
+   * Responses are read by MCP clients, not people, so they are serialized
+   * compactly: pretty-printing large search results costs noticeably more
+   * time and output size.
    */
   protected formatSuccessResponse(data: Record<string, unknown>): string {
-    return JSON.stringify({ success: true, ...data }, null, 2);
+    return JSON.stringify({ success: true, ...data });
   }
 
   /**
@@ -123,7 +127,7 @@ export abstract class BaseHandler {
    */
   protected formatErrorResponse(error: unknown, context?: RequestContext): string {
     const mcpError = handleError(error, context ? { traceId: context.traceId } : {});
-    return JSON.stringify(mcpError.toMCPResponse(), null, 2);
+    return JSON.stringify(mcpError.toMCPResponse());
   }
 
   // Async versions for async handlers
@@ -1,10 +1,16 @@
 import { existsSync, readFileSync } from 'fs';
-import { access, readFile } from 'fs/promises';
+import { readFile } from 'fs/promises';
 import { join } from 'path';
 
 import type { z } from 'zod';
 
-import { parseDocument, parseChapters, writeDocument, writeDocumentAsync } from '../documents.js';
+import {
+  parseDocument,
+  parseChapters,
+  parseSections,
+  writeDocument,
+  writeDocumentAsync,
+} from '../documents.js';
 import type { Chapter } from '../documents.js';
 import { MCPError, MCPErrorCode } from '../errors/index.js';
 import type {
@@ -68,7 +74,7 @@ export class ChapterToolHandler extends BaseHandler {
       // Read and parse the document
       const content = readFileSync(filePath, 'utf8');
       const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
+      const { introduction, chapters } = parseSections(body);
 
       // Find and update the chapter
       let chapterFound = false;
@@ -99,14 +105,12 @@ export class ChapterToolHandler extends BaseHandler {
       // Update metadata
       metadata.updated = new Date().toISOString();
 
-      // Extract introduction (content before first chapter)
-      const firstChapterIndex = body.indexOf('\n##');
-      const introduction = firstChapterIndex > 0 ? body.slice(0, firstChapterIndex).trim() : '';
-
       // Build document content
-      const documentContent = [introduction, '', ...updatedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      const documentContent = [
+        introduction.trim(),
+        '',
+        ...updatedChapters.map((ch) => ch.content),
+      ].join('\n\n');
 
       // Write updated document
       const validatedPath = validatePath(knowledgePath, filename);
@@ -187,7 +191,7 @@ export class ChapterToolHandler extends BaseHandler {
       // Read and parse the document
       const content = readFileSync(filePath, 'utf8');
       const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
+      const { introduction, chapters } = parseSections(body);
 
       // Find and remove the chapter
       const originalCount = chapters.length;
@@ -204,14 +208,12 @@ export class ChapterToolHandler extends BaseHandler {
       // Update metadata
       metadata.updated = new Date().toISOString();
 
-      // Extract introduction
-      const firstChapterIndex = body.indexOf('\n##');
-      const introduction = firstChapterIndex > 0 ? body.slice(0, firstChapterIndex).trim() : '';
-
       // Build document content
-      const documentContent = [introduction, '', ...updatedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      const documentContent = [
+        introduction.trim(),
+        '',
+        ...updatedChapters.map((ch) => ch.content),
+      ].join('\n\n');
 
       // Write updated document
       const validatedPath = validatePath(knowledgePath, filename);
@@ -302,7 +304,7 @@ export class ChapterToolHandler extends BaseHandler {
       // Read and parse the document
       const fileContent = readFileSync(filePath, 'utf8');
       const [metadata, body] = parseDocument(fileContent);
-      const chapters = parseChapters(body);
+      const { introduction, chapters } = parseSections(body);
 
       // Check if chapter already exists
       for (const chapter of chapters) {
@@ -315,10 +317,6 @@ export class ChapterToolHandler extends BaseHandler {
         }
       }
 
-      // Extract introduction (content before first chapter)
-      const firstChapterIndex = body.indexOf('\n##');
-      const introduction = firstChapterIndex > 0 ? body.slice(0, firstChapterIndex).trim() : '';
-
       // Create new chapter
       const newChapter: Chapter = {
         title: chapter_title,
@@ -371,9 +369,11 @@ export class ChapterToolHandler extends BaseHandler {
       metadata.updated = new Date().toISOString();
 
       // Build document content
-      const documentContent = [introduction, '', ...updatedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      const documentContent = [
+        introduction.trim(),
+        '',
+        ...updatedChapters.map((ch) => ch.content),
+      ].join('\n\n');
 
       // Write updated document
       const validatedPath = validatePath(knowledgePath, filename);
@@ -444,9 +444,10 @@ export class ChapterToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = join(knowledgePath, filename);
 
-      // Check if file exists
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(filePath);
+        content = await readFile(filePath, 'utf8');
       } catch (error) {
         if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
           throw new MCPError(
@@ -458,10 +459,8 @@ export class ChapterToolHandler extends BaseHandler {
         throw error;
       }
 
-      // Read and parse the document
-      const content = await readFile(filePath, 'utf8');
       const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
+      const { introduction, chapters } = parseSections(body);
 
       // Find and update the chapter
       let chapterFound = false;
@@ -492,14 +491,12 @@ export class ChapterToolHandler extends BaseHandler {
       // Update metadata
       metadata.updated = new Date().toISOString();
 
-      // Extract introduction (content before first chapter)
-      const firstChapterIndex = body.indexOf('\n##');
-      const introduction = firstChapterIndex > 0 ? body.slice(0, firstChapterIndex).trim() : '';
-
       // Build document content
-      const documentContent = [introduction, '', ...updatedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      const documentContent = [
+        introduction.trim(),
+        '',
+        ...updatedChapters.map((ch) => ch.content),
+      ].join('\n\n');
 
       // Write updated document
       const validatedPath = await validatePathAsync(knowledgePath, filename);
@@ -508,7 +505,11 @@ export class ChapterToolHandler extends BaseHandler {
       // Auto-commit
       await autoCommitAsync(this.storagePath, `Update chapter "${chapter_title}" in ${filename}`);
 
-      this.logSuccess('update_chapter', { project_id, filename, chapter_title }, context);
+      await this.logSuccessAsync(
+        'update_chapter',
+        { project_id, filename, chapter_title },
+        context
+      );
       return this.formatSuccessResponse({
         message: `Chapter "${chapter_title}" updated in ${filename}`,
       });
@@ -526,7 +527,7 @@ export class ChapterToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'update_chapter',
         {
           project_id: params.project_id,
@@ -568,9 +569,10 @@ export class ChapterToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = join(knowledgePath, filename);
 
-      // Check if file exists
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(filePath);
+        content = await readFile(filePath, 'utf8');
       } catch (error) {
         if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
           throw new MCPError(
@@ -582,10 +584,8 @@ export class ChapterToolHandler extends BaseHandler {
         throw error;
       }
 
-      // Read and parse the document
-      const content = await readFile(filePath, 'utf8');
       const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
+      const { introduction, chapters } = parseSections(body);
 
       // Find and remove the chapter
       const originalCount = chapters.length;
@@ -602,14 +602,12 @@ export class ChapterToolHandler extends BaseHandler {
       // Update metadata
       metadata.updated = new Date().toISOString();
 
-      // Extract introduction
-      const firstChapterIndex = body.indexOf('\n##');
-      const introduction = firstChapterIndex > 0 ? body.slice(0, firstChapterIndex).trim() : '';
-
       // Build document content
-      const documentContent = [introduction, '', ...updatedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      const documentContent = [
+        introduction.trim(),
+        '',
+        ...updatedChapters.map((ch) => ch.content),
+      ].join('\n\n');
 
       // Write updated document
       const validatedPath = await validatePathAsync(knowledgePath, filename);
@@ -618,7 +616,11 @@ export class ChapterToolHandler extends BaseHandler {
       // Auto-commit
       await autoCommitAsync(this.storagePath, `Remove chapter "${chapter_title}" from ${filename}`);
 
-      this.logSuccess('remove_chapter', { project_id, filename, chapter_title }, context);
+      await this.logSuccessAsync(
+        'remove_chapter',
+        { project_id, filename, chapter_title },
+        context
+      );
       return this.formatSuccessResponse({
         message: `Chapter "${chapter_title}" removed from ${filename}`,
       });
@@ -636,7 +638,7 @@ export class ChapterToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'remove_chapter',
         {
           project_id: params.project_id,
@@ -688,9 +690,10 @@ export class ChapterToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = join(knowledgePath, filename);
 
-      // Check if file exists
+      // Read the file in one step; failing to open it means it is missing
+      let fileContent: string;
       try {
-        await access(filePath);
+        fileContent = await readFile(filePath, 'utf8');
       } catch (error) {
         if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
           throw new MCPError(
@@ -702,10 +705,8 @@ export class ChapterToolHandler extends BaseHandler {
         throw error;
       }
 
-      // Read and parse the document
-      const fileContent = await readFile(filePath, 'utf8');
       const [metadata, body] = parseDocument(fileContent);
-      const chapters = parseChapters(body);
+      const { introduction, chapters } = parseSections(body);
 
       // Check if chapter already exists
       for (const chapter of chapters) {
@@ -718,10 +719,6 @@ export class ChapterToolHandler extends BaseHandler {
         }
       }
 
-      // Extract introduction (content before first chapter)
-      const firstChapterIndex = body.indexOf('\n##');
-      const introduction = firstChapterIndex > 0 ? body.slice(0, firstChapterIndex).trim() : '';
-
       // Create new chapter
       const newChapter: Chapter = {
         title: chapter_title,
@@ -774,9 +771,11 @@ export class ChapterToolHandler extends BaseHandler {
       metadata.updated = new Date().toISOString();
 
       // Build document content
-      const documentContent = [introduction, '', ...updatedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      const documentContent = [
+        introduction.trim(),
+        '',
+        ...updatedChapters.map((ch) => ch.content),
+      ].join('\n\n');
 
       // Write updated document
       const validatedPath = await validatePathAsync(knowledgePath, filename);
@@ -785,7 +784,7 @@ export class ChapterToolHandler extends BaseHandler {
       // Auto-commit
       await autoCommitAsync(this.storagePath, `Add chapter "${chapter_title}" to ${filename}`);
 
-      this.logSuccess('add_chapter', { project_id, filename, chapter_title }, context);
+      await this.logSuccessAsync('add_chapter', { project_id, filename, chapter_title }, context);
       return this.formatSuccessResponse({
         message: `Chapter "${chapter_title}" added to ${filename}`,
       });
@@ -803,7 +802,7 @@ export class ChapterToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'add_chapter',
         {
           project_id: params.project_id,
@@ -838,9 +837,10 @@ export class ChapterToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = await validatePathAsync(knowledgePath, filename);
 
-      // Check if file exists
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(filePath);
+        content = await readFile(filePath, 'utf8');
       } catch {
         throw new MCPError(
           MCPErrorCode.DOCUMENT_NOT_FOUND,
@@ -849,8 +849,6 @@ export class ChapterToolHandler extends BaseHandler {
         );
       }
 
-      // Read and parse the document
-      const content = await readFile(filePath, 'utf8');
       const [, body] = parseDocument(content);
       const chapters = parseChapters(body);
 
@@ -861,7 +859,7 @@ export class ChapterToolHandler extends BaseHandler {
         index,
       }));
 
-      this.logSuccess('list_chapters', { project_id, filename }, context);
+      await this.logSuccessAsync('list_chapters', { project_id, filename }, context);
       return this.formatSuccessResponse({
         project_id,
         filename,
@@ -881,7 +879,7 @@ export class ChapterToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError('list_chapters', params, mcpError, context);
+      await this.logErrorAsync('list_chapters', params, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -915,9 +913,10 @@ export class ChapterToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = await validatePathAsync(knowledgePath, filename);
 
-      // Check if file exists
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(filePath);
+        content = await readFile(filePath, 'utf8');
       } catch {
         throw new MCPError(
           MCPErrorCode.DOCUMENT_NOT_FOUND,
@@ -926,8 +925,6 @@ export class ChapterToolHandler extends BaseHandler {
         );
       }
 
-      // Read and parse the document
-      const content = await readFile(filePath, 'utf8');
       const [, body] = parseDocument(content);
       const chapters = parseChapters(body);
 
@@ -971,7 +968,11 @@ export class ChapterToolHandler extends BaseHandler {
         );
       }
 
-      this.logSuccess('get_chapter', { project_id, filename, chapter_index: targetIndex }, context);
+      await this.logSuccessAsync(
+        'get_chapter',
+        { project_id, filename, chapter_index: targetIndex },
+        context
+      );
       return this.formatSuccessResponse({
         project_id,
         filename,
@@ -996,7 +997,7 @@ export class ChapterToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError('get_chapter', params, mcpError, context);
+      await this.logErrorAsync('get_chapter', params, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -1030,9 +1031,10 @@ export class ChapterToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = await validatePathAsync(knowledgePath, filename);
 
-      // Check if file exists
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(filePath);
+        content = await readFile(filePath, 'utf8');
       } catch {
         throw new MCPError(
           MCPErrorCode.DOCUMENT_NOT_FOUND,
@@ -1041,8 +1043,6 @@ export class ChapterToolHandler extends BaseHandler {
         );
       }
 
-      // Read and parse the document
-      const content = await readFile(filePath, 'utf8');
       const [, body] = parseDocument(content);
       const chapters = parseChapters(body);
 
@@ -1086,7 +1086,7 @@ export class ChapterToolHandler extends BaseHandler {
       // Check if there's a next chapter
       const nextIdx = currentIdx + 1;
       if (nextIdx >= chapters.length) {
-        this.logSuccess(
+        await this.logSuccessAsync(
           'get_next_chapter',
           { project_id, filename, current_index: currentIdx },
           context
@@ -1102,7 +1102,7 @@ export class ChapterToolHandler extends BaseHandler {
       }
 
       const nextChapter = chapters[nextIdx];
-      this.logSuccess(
+      await this.logSuccessAsync(
         'get_next_chapter',
         { project_id, filename, current_index: currentIdx, next_index: nextIdx },
         context
@@ -1131,7 +1131,7 @@ export class ChapterToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError('get_next_chapter', params, mcpError, context);
+      await this.logErrorAsync('get_next_chapter', params, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
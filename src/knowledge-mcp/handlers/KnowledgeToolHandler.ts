@@ -5,7 +5,7 @@ import { join } from 'path';
 import type { z } from 'zod';
 
 import { parseDocument, writeDocument, writeDocumentAsync } from '../documents.js';
-import type { DocumentMetadata, Chapter } from '../documents.js';
+import type { DocumentMetadata } from '../documents.js';
 import { MCPError, MCPErrorCode } from '../errors/index.js';
 import type {
   secureProjectIdSchema,
@@ -68,26 +68,22 @@ export class KnowledgeToolHandler extends BaseHandler {
         );
       }
 
-      // Prepare metadata
+      // Prepare metadata; a new file's created and updated times are the same
+      const now = new Date().toISOString();
       const metadata: DocumentMetadata = {
         title,
         keywords,
-        created: new Date().toISOString(),
-        updated: new Date().toISOString(),
+        created: now,
+        updated: now,
       };
 
-      // Prepare chapters
-      const formattedChapters: Chapter[] = chapters.map((ch) => ({
-        title: ch.title,
-        level: 2,
-        content: `## ${ch.title}\n\n${ch.content}`,
-        summary: ch.content.split('\n')[0].slice(0, 100) + '...',
-      }));
-
-      // Build document content
-      const documentContent = [introduction, '', ...formattedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      // Build document content in a single join, formatting each chapter
+      // directly instead of through intermediate chapter objects
+      const documentContent = [
+        introduction,
+        '',
+        ...chapters.map((ch) => `## ${ch.title}\n\n${ch.content}`),
+      ].join('\n\n');
 
       // Write the document
       const validatedPath = validatePath(knowledgePath, mdFilename);
@@ -333,26 +329,22 @@ export class KnowledgeToolHandler extends BaseHandler {
         }
       }
 
-      // Prepare metadata
+      // Prepare metadata; a new file's created and updated times are the same
+      const now = new Date().toISOString();
       const metadata: DocumentMetadata = {
         title,
         keywords,
-        created: new Date().toISOString(),
-        updated: new Date().toISOString(),
+        created: now,
+        updated: now,
       };
 
-      // Prepare chapters
-      const formattedChapters: Chapter[] = chapters.map((ch) => ({
-        title: ch.title,
-        level: 2,
-        content: `## ${ch.title}\n\n${ch.content}`,
-        summary: ch.content.split('\n')[0].slice(0, 100) + '...',
-      }));
-
-      // Build document content
-      const documentContent = [introduction, '', ...formattedChapters.map((ch) => ch.content)].join(
-        '\n\n'
-      );
+      // Build document content in a single join, formatting each chapter
+      // directly instead of through intermediate chapter objects
+      const documentContent = [
+        introduction,
+        '',
+        ...chapters.map((ch) => `## ${ch.title}\n\n${ch.content}`),
+      ].join('\n\n');
 
       // Write the document
       const validatedPath = await validatePathAsync(knowledgePath, mdFilename);
@@ -364,7 +356,11 @@ export class KnowledgeToolHandler extends BaseHandler {
         `Create knowledge file ${mdFilename} in ${originalId}`
       );
 
-      this.logSuccess('create_knowledge_file', { project_id, filename: mdFilename }, context);
+      await this.logSuccessAsync(
+        'create_knowledge_file',
+        { project_id, filename: mdFilename },
+        context
+      );
       return this.formatSuccessResponse({
         filepath: `knowledge/${mdFilename}`,
         message: `Knowledge file ${mdFilename} created in project ${originalId}`,
@@ -382,7 +378,7 @@ export class KnowledgeToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'create_knowledge_file',
         {
           project_id: params.project_id,
@@ -454,7 +450,7 @@ export class KnowledgeToolHandler extends BaseHandler {
           };
         });
 
-      this.logSuccess('get_knowledge_file', { project_id, filename }, context);
+      await this.logSuccessAsync('get_knowledge_file', { project_id, filename }, context);
       return this.formatSuccessResponse({
         document: {
           filename,
@@ -476,7 +472,7 @@ export class KnowledgeToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'get_knowledge_file',
         {
           project_id: params.project_id,
@@ -515,9 +511,9 @@ export class KnowledgeToolHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = join(knowledgePath, filename);
 
-      // Check if file exists
+      // Delete the file; unlinking a missing file fails with ENOENT
       try {
-        await access(filePath);
+        await unlink(filePath);
       } catch (error) {
         if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
           throw new MCPError(
@@ -529,16 +525,13 @@ export class KnowledgeToolHandler extends BaseHandler {
         throw error;
       }
 
-      // Delete the file
-      await unlink(filePath);
-
       // Auto-commit
       await autoCommitAsync(
         this.storagePath,
         `Delete knowledge file ${filename} from ${originalId}`
       );
 
-      this.logSuccess('delete_knowledge_file', { project_id, filename }, context);
+      await this.logSuccessAsync('delete_knowledge_file', { project_id, filename }, context);
       return this.formatSuccessResponse({
         message: `Knowledge file ${filename} deleted from project ${originalId}`,
       });
@@ -555,7 +548,7 @@ export class KnowledgeToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'delete_knowledge_file',
         {
           project_id: params.project_id,
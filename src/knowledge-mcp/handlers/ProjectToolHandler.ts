@@ -28,6 +28,9 @@ import {
 
 import { BaseHandler } from './BaseHandler.js';
 
+// get_project_main result for a missing project or main.md, built once
+const MISSING_PROJECT_MAIN_RESPONSE = JSON.stringify({ success: true, exists: false, content: '' });
+
 export class ProjectToolHandler extends BaseHandler {
   /**
    * Get project main instructions
@@ -42,10 +45,7 @@ export class ProjectToolHandler extends BaseHandler {
       // Project doesn't exist - return exists: false
       if (!projectInfo) {
         this.logSuccess('get_project_main', { project_id }, context);
-        return this.formatSuccessResponse({
-          exists: false,
-          content: '',
-        });
+        return MISSING_PROJECT_MAIN_RESPONSE;
       }
 
       const [, projectPath] = projectInfo;
@@ -53,10 +53,7 @@ export class ProjectToolHandler extends BaseHandler {
 
       if (!existsSync(mainFile)) {
         this.logSuccess('get_project_main', { project_id }, context);
-        return this.formatSuccessResponse({
-          exists: false,
-          content: '',
-        });
+        return MISSING_PROJECT_MAIN_RESPONSE;
       }
 
       const content = readFileSync(mainFile, 'utf8');
@@ -496,17 +493,13 @@ export class ProjectToolHandler extends BaseHandler {
       // Project doesn't exist - return exists: false
       if (!projectInfo) {
         await this.logSuccessAsync('get_project_main', { project_id }, context);
-        return this.formatSuccessResponse({
-          exists: false,
-          content: '',
-        });
+        return MISSING_PROJECT_MAIN_RESPONSE;
       }
 
       const [, projectPath] = projectInfo;
       const mainFile = join(projectPath, 'main.md');
 
       try {
-        await access(mainFile);
         const content = await readFile(mainFile, 'utf8');
         await this.logSuccessAsync('get_project_main', { project_id }, context);
         return this.formatSuccessResponse({
@@ -515,10 +508,7 @@ export class ProjectToolHandler extends BaseHandler {
         });
       } catch {
         await this.logSuccessAsync('get_project_main', { project_id }, context);
-        return this.formatSuccessResponse({
-          exists: false,
-          content: '',
-        });
+        return MISSING_PROJECT_MAIN_RESPONSE;
       }
     } catch (error) {
       const mcpError =
@@ -610,8 +600,10 @@ export class ProjectToolHandler extends BaseHandler {
       const [originalId, projectPath] = projectInfo;
       const mainFile = join(projectPath, 'main.md');
 
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(mainFile);
+        content = await readFile(mainFile, 'utf8');
       } catch {
         throw new MCPError(MCPErrorCode.PROJECT_NOT_FOUND, `Project ${originalId} does not exist`, {
           project_id,
@@ -620,7 +612,6 @@ export class ProjectToolHandler extends BaseHandler {
         });
       }
 
-      const content = await readFile(mainFile, 'utf8');
       const lines = content.split('\n');
 
       // Find the section
@@ -720,8 +711,10 @@ export class ProjectToolHandler extends BaseHandler {
       const [originalId, projectPath] = projectInfo;
       const mainFile = join(projectPath, 'main.md');
 
+      // Read the file in one step; failing to open it means it is missing
+      let content: string;
       try {
-        await access(mainFile);
+        content = await readFile(mainFile, 'utf8');
       } catch {
         throw new MCPError(MCPErrorCode.PROJECT_NOT_FOUND, `Project ${originalId} does not exist`, {
           project_id,
@@ -730,7 +723,6 @@ export class ProjectToolHandler extends BaseHandler {
         });
       }
 
-      const content = await readFile(mainFile, 'utf8');
       const lines = content.split('\n');
 
       // Find the section
@@ -1,15 +1,74 @@
-import { existsSync, readFileSync, readdirSync } from 'fs';
-import { access, readFile, readdir } from 'fs/promises';
+import { existsSync, readFileSync, readdirSync, statSync } from 'fs';
+import type { Dirent } from 'fs';
+import { readFile, readdir, stat } from 'fs/promises';
 import { join } from 'path';
 
 import type { ReadResourceResult } from '@modelcontextprotocol/sdk/types.js';
 
-import { parseDocument, parseChapters } from '../documents.js';
+import {
+  loadParsedDocument,
+  loadParsedDocumentAsync,
+  readDocumentMetadata,
+  readDocumentMetadataAsync,
+} from '../documents.js';
+import type { DocumentMetadata, ParsedDocument } from '../documents.js';
 import { MCPError, MCPErrorCode } from '../errors/index.js';
-import { getProjectDirectory, getProjectDirectoryAsync } from '../utils.js';
+import {
+  getProjectDirectory,
+  getProjectDirectoryAsync,
+  validatePath,
+  validatePathAsync,
+} from '../utils.js';
 
 import { BaseHandler } from './BaseHandler.js';
 
+// Listing text for a project without knowledge files
+const EMPTY_FILES_TEXT = JSON.stringify({ files: [] });
+
+/**
+ * Whether a knowledge directory entry belongs in a file listing. Regular files
+ * are taken from the entry's own type; symlinks are listed only when they stay
+ * inside the knowledge directory and point at a regular file.
+ */
+function isListedKnowledgeFile(knowledgePath: string, entry: Dirent): boolean {
+  if (!entry.name.endsWith('.md')) {
+    return false;
+  }
+  if (entry.isFile()) {
+    return true;
+  }
+  if (!entry.isSymbolicLink()) {
+    return false;
+  }
+  try {
+    return statSync(validatePath(knowledgePath, entry.name)).isFile();
+  } catch {
+    // Escaping, broken or non-file links are left out
+    return false;
+  }
+}
+
+/**
+ * Async version of isListedKnowledgeFile.
+ */
+async function isListedKnowledgeFileAsync(knowledgePath: string, entry: Dirent): Promise<boolean> {
+  if (!entry.name.endsWith('.md')) {
+    return false;
+  }
+  if (entry.isFile()) {
+    return true;
+  }
+  if (!entry.isSymbolicLink()) {
+    return false;
+  }
+  try {
+    return (await stat(await validatePathAsync(knowledgePath, entry.name))).isFile();
+  } catch {
+    // Escaping, broken or non-file links are left out
+    return false;
+  }
+}
+
 export class ResourceHandler extends BaseHandler {
   /**
    * Get project main resource
@@ -106,7 +165,7 @@ export class ResourceHandler extends BaseHandler {
           contents: [
             {
               uri: uri.href,
-              text: JSON.stringify({ files: [] }, null, 2),
+              text: EMPTY_FILES_TEXT,
             },
           ],
         };
@@ -120,30 +179,35 @@ export class ResourceHandler extends BaseHandler {
           contents: [
             {
               uri: uri.href,
-              text: JSON.stringify({ files: [] }, null, 2),
+              text: EMPTY_FILES_TEXT,
             },
           ],
         };
       }
 
-      const files = readdirSync(knowledgePath)
-        .filter((f) => f.endsWith('.md'))
-        .map((mdFile) => {
+      // Filter on the directory entries' own type info; only symlinks need a stat
+      const files = readdirSync(knowledgePath, { withFileTypes: true })
+        .filter((entry) => isListedKnowledgeFile(knowledgePath, entry))
+        .map(({ name: mdFile }) => {
+          let metadata: DocumentMetadata | null;
           try {
-            const content = readFileSync(join(knowledgePath, mdFile), 'utf8');
-            const [metadata, _] = parseDocument(content);
-
-            return {
-              filename: mdFile,
-              title: metadata.title ?? 'Untitled',
-              keywords: metadata.keywords ?? [],
-              created: metadata.created ?? '',
-              updated: metadata.updated ?? '',
-            } as const;
+            metadata = readDocumentMetadata(join(knowledgePath, mdFile));
           } catch {
-            // Skip files that can't be parsed
+            // Skip files that can't be read
+            return null;
+          }
+          if (!metadata) {
+            // Skip files that were removed or can't be parsed
             return null;
           }
+
+          return {
+            filename: mdFile,
+            title: metadata.title ?? 'Untitled',
+            keywords: metadata.keywords ?? [],
+            created: metadata.created ?? '',
+            updated: metadata.updated ?? '',
+          } as const;
         })
         .filter((f) => f !== null);
 
@@ -152,7 +216,7 @@ export class ResourceHandler extends BaseHandler {
         contents: [
           {
             uri: uri.href,
-            text: JSON.stringify({ files }, null, 2),
+            text: JSON.stringify({ files }),
           },
         ],
       };
@@ -224,9 +288,7 @@ export class ResourceHandler extends BaseHandler {
         };
       }
 
-      const content = readFileSync(filePath, 'utf8');
-      const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
+      const { metadata, chapters } = loadParsedDocument(filePath);
 
       const chapterList = chapters.map((ch) => ({
         title: ch.title,
@@ -238,16 +300,12 @@ export class ResourceHandler extends BaseHandler {
         contents: [
           {
             uri: uri.href,
-            text: JSON.stringify(
-              {
-                filename,
-                title: metadata.title ?? 'Untitled',
-                chapters: chapterList,
-                count: chapterList.length,
-              },
-              null,
-              2
-            ),
+            text: JSON.stringify({
+              filename,
+              title: metadata.title ?? 'Untitled',
+              chapters: chapterList,
+              count: chapterList.length,
+            }),
           },
         ],
       };
@@ -314,7 +372,7 @@ export class ResourceHandler extends BaseHandler {
 
       try {
         const content = await readFile(mainFile, 'utf8');
-        this.logSuccess('get_project_main_resource', { project_id }, context);
+        await this.logSuccessAsync('get_project_main_resource', { project_id }, context);
         return {
           contents: [
             {
@@ -345,7 +403,7 @@ export class ResourceHandler extends BaseHandler {
               `Failed to read project main resource: ${error instanceof Error ? error.message : String(error)}`,
               { project_id: params.project_id, uri: uri.href, traceId: context.traceId }
             );
-      this.logError(
+      await this.logErrorAsync(
         'get_project_main_resource',
         { project_id: String(params.project_id) },
         mcpError,
@@ -396,10 +454,15 @@ export class ResourceHandler extends BaseHandler {
       const [, projectPath] = projectInfo;
       const knowledgePath = join(projectPath, 'knowledge');
 
-      // Check if knowledge directory exists
+      // Read all .md files from knowledge directory; a missing directory
+      // means there are none
+      let entries: Dirent[];
       try {
-        await access(knowledgePath);
-      } catch {
+        entries = await readdir(knowledgePath, { withFileTypes: true });
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+          throw error;
+        }
         return {
           contents: [
             {
@@ -410,36 +473,39 @@ export class ResourceHandler extends BaseHandler {
           ],
         };
       }
-
-      // Read all .md files from knowledge directory
-      const files = await readdir(knowledgePath);
-      const mdFiles = files.filter((file) => file.endsWith('.md'));
+      const listed = await Promise.all(
+        entries.map((entry) => isListedKnowledgeFileAsync(knowledgePath, entry))
+      );
+      const mdFiles = entries.filter((_, i) => listed[i]).map((entry) => entry.name);
 
       // Read metadata from each file
       const fileInfos = await Promise.all(
         mdFiles.map(async (file) => {
+          let metadata: DocumentMetadata | null;
           try {
-            const filePath = join(knowledgePath, file);
-            const content = await readFile(filePath, 'utf8');
-            const [metadata] = parseDocument(content);
-
-            return {
-              filename: file,
-              title: metadata.title ?? file.replace('.md', ''),
-              keywords: metadata.keywords ?? [],
-              created: metadata.created ?? '',
-              updated: metadata.updated ?? '',
-            };
+            metadata = await readDocumentMetadataAsync(join(knowledgePath, file));
           } catch (error) {
             console.error(`Error reading ${file}:`, error);
             return null;
           }
+          if (!metadata) {
+            console.error(`Skipping ${file}: file removed or frontmatter is not valid YAML`);
+            return null;
+          }
+
+          return {
+            filename: file,
+            title: metadata.title ?? file.replace('.md', ''),
+            keywords: metadata.keywords ?? [],
+            created: metadata.created ?? '',
+            updated: metadata.updated ?? '',
+          };
         })
       );
 
       // Filter out nulls and convert to JSON
       const validFiles = fileInfos.filter((info) => info !== null);
-      this.logSuccess(
+      await this.logSuccessAsync(
         'list_knowledge_files_resource',
         { project_id, count: validFiles.length },
         context
@@ -448,7 +514,7 @@ export class ResourceHandler extends BaseHandler {
         contents: [
           {
             uri: uri.href,
-            text: JSON.stringify(validFiles, null, 2),
+            text: JSON.stringify(validFiles),
             mimeType: 'application/json',
           },
         ],
@@ -462,7 +528,7 @@ export class ResourceHandler extends BaseHandler {
               `Failed to list knowledge files: ${error instanceof Error ? error.message : String(error)}`,
               { project_id: params.project_id, uri: uri.href, traceId: context.traceId }
             );
-      this.logError(
+      await this.logErrorAsync(
         'list_knowledge_files_resource',
         { project_id: String(params.project_id) },
         mcpError,
@@ -514,10 +580,14 @@ export class ResourceHandler extends BaseHandler {
       const knowledgePath = join(projectPath, 'knowledge');
       const filePath = join(knowledgePath, filename);
 
-      // Check if file exists
+      // Read and parse the document; a missing file lists no chapters
+      let document: ParsedDocument;
       try {
-        await access(filePath);
-      } catch {
+        document = await loadParsedDocumentAsync(filePath);
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+          throw error;
+        }
         return {
           contents: [
             {
@@ -528,11 +598,7 @@ export class ResourceHandler extends BaseHandler {
           ],
         };
       }
-
-      // Read and parse the document
-      const content = await readFile(filePath, 'utf8');
-      const [metadata, body] = parseDocument(content);
-      const chapters = parseChapters(body);
+      const { metadata, chapters } = document;
 
       // Format chapters for response
       const chapterList = chapters.map((ch) => ({
@@ -541,7 +607,7 @@ export class ResourceHandler extends BaseHandler {
         summary: ch.summary,
       }));
 
-      this.logSuccess(
+      await this.logSuccessAsync(
         'list_chapters_resource',
         { project_id, filename, count: chapterList.length },
         context
@@ -550,18 +616,14 @@ export class ResourceHandler extends BaseHandler {
         contents: [
           {
             uri: uri.href,
-            text: JSON.stringify(
-              {
-                document: {
-                  filename,
-                  title: metadata.title ?? filename.replace('.md', ''),
-                  keywords: metadata.keywords ?? [],
-                },
-                chapters: chapterList,
+            text: JSON.stringify({
+              document: {
+                filename,
+                title: metadata.title ?? filename.replace('.md', ''),
+                keywords: metadata.keywords ?? [],
               },
-              null,
-              2
-            ),
+              chapters: chapterList,
+            }),
             mimeType: 'application/json',
           },
         ],
@@ -580,7 +642,7 @@ export class ResourceHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'list_chapters_resource',
         { project_id: String(params.project_id), filename: String(params.filename) },
         mcpError,
@@ -1,13 +1,20 @@
 import type { z } from 'zod';
 
-import { searchDocuments, searchDocumentsAsync } from '../documents.js';
-import type { SearchResult } from '../documents.js';
+import { iterateSearchResults, iterateSearchResultsAsync } from '../documents.js';
 import { MCPError, MCPErrorCode } from '../errors/index.js';
 import type { secureProjectIdSchema, secureSearchQuerySchema } from '../schemas/validation.js';
 import { getProjectDirectory, getProjectDirectoryAsync } from '../utils.js';
 
 import { BaseHandler } from './BaseHandler.js';
 
+// Search result for a project that does not exist; it never varies
+const EMPTY_SEARCH_RESPONSE = JSON.stringify({
+  success: true,
+  total_documents: 0,
+  total_matches: 0,
+  results: [],
+});
+
 export class SearchToolHandler extends BaseHandler {
   /**
    * Search knowledge documents
@@ -25,37 +32,32 @@ export class SearchToolHandler extends BaseHandler {
       // Project doesn't exist - return empty results without creating ghost entry
       if (!projectInfo) {
         this.logSuccess('search_knowledge', { project_id }, context);
-        return this.formatSuccessResponse({
-          total_documents: 0,
-          total_matches: 0,
-          results: [],
-        });
+        return EMPTY_SEARCH_RESPONSE;
       }
 
       const [, projectPath] = projectInfo;
 
-      // Parse search keywords
-      const keywords = query
-        .toLowerCase()
-        .split(/\s+/)
-        .filter((k) => k.length > 0);
-
-      // Search documents - pass projectPath, not knowledgePath
-      const results = searchDocuments(projectPath, keywords.join(' '));
-
-      // Transform results for response - matching test expectations
-      const transformedResults = results.map((result: SearchResult) => ({
-        document: result.file,
-        chapters: result.matching_chapters.map((ch) => ({
-          title: ch.chapter || '(Document Introduction)',
-          matches: ch.keywords_found.length,
-        })),
-      }));
+      // Search documents - pass projectPath, not knowledgePath. Results are
+      // transformed and counted as each document is searched, in one pass.
+      const transformedResults = [];
+      let totalMatches = 0;
+      for (const result of iterateSearchResults(projectPath, query)) {
+        totalMatches += result.match_count;
+
+        // Transform results for response - matching test expectations
+        transformedResults.push({
+          document: result.file,
+          chapters: result.matching_chapters.map((ch) => ({
+            title: ch.chapter || '(Document Introduction)',
+            matches: ch.keywords_found.length,
+          })),
+        });
+      }
 
       this.logSuccess('search_knowledge', { project_id }, context);
       return this.formatSuccessResponse({
         total_documents: transformedResults.length,
-        total_matches: results.reduce((sum, r) => sum + r.match_count, 0),
+        total_matches: totalMatches,
         results: transformedResults,
       });
     } catch (error) {
@@ -99,38 +101,33 @@ export class SearchToolHandler extends BaseHandler {
 
       // Project doesn't exist - return empty results without creating ghost entry
       if (!projectInfo) {
-        this.logSuccess('search_knowledge', { project_id }, context);
-        return this.formatSuccessResponse({
-          total_documents: 0,
-          total_matches: 0,
-          results: [],
-        });
+        await this.logSuccessAsync('search_knowledge', { project_id }, context);
+        return EMPTY_SEARCH_RESPONSE;
       }
 
       const [, projectPath] = projectInfo;
 
-      // Parse search keywords
-      const keywords = query
-        .toLowerCase()
-        .split(/\s+/)
-        .filter((k) => k.length > 0);
-
-      // Search documents - pass projectPath, not knowledgePath
-      const results = await searchDocumentsAsync(projectPath, keywords.join(' '));
-
-      // Transform results for response - matching test expectations
-      const transformedResults = results.map((result: SearchResult) => ({
-        document: result.file,
-        chapters: result.matching_chapters.map((ch) => ({
-          title: ch.chapter || '(Document Introduction)',
-          matches: ch.keywords_found.length,
-        })),
-      }));
+      // Search documents - pass projectPath, not knowledgePath. Results are
+      // transformed and counted as each document is searched, in one pass.
+      const transformedResults = [];
+      let totalMatches = 0;
+      for await (const result of iterateSearchResultsAsync(projectPath, query)) {
+        totalMatches += result.match_count;
+
+        // Transform results for response - matching test expectations
+        transformedResults.push({
+          document: result.file,
+          chapters: result.matching_chapters.map((ch) => ({
+            title: ch.chapter || '(Document Introduction)',
+            matches: ch.keywords_found.length,
+          })),
+        });
+      }
 
-      this.logSuccess('search_knowledge', { project_id }, context);
+      await this.logSuccessAsync('search_knowledge', { project_id }, context);
       return this.formatSuccessResponse({
         total_documents: transformedResults.length,
-        total_matches: results.reduce((sum, r) => sum + r.match_count, 0),
+        total_matches: totalMatches,
         results: transformedResults,
       });
     } catch (error) {
@@ -146,7 +143,7 @@ export class SearchToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError(
+      await this.logErrorAsync(
         'search_knowledge',
         {
           project_id: params.project_id,
@@ -331,7 +331,7 @@ export class ServerToolHandler extends BaseHandler {
         status_details: statusOutput.trim() || 'Working tree clean',
       };
 
-      this.logSuccess('get_storage_status', {}, context);
+      await this.logSuccessAsync('get_storage_status', {}, context);
       return this.formatSuccessResponse(result);
     } catch (error) {
       const mcpError = new MCPError(
@@ -339,7 +339,7 @@ export class ServerToolHandler extends BaseHandler {
         `Failed to get storage status: ${error instanceof Error ? error.message : String(error)}`,
         { traceId: context.traceId }
       );
-      this.logError('get_storage_status', {}, mcpError, context);
+      await this.logErrorAsync('get_storage_status', {}, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -362,7 +362,7 @@ export class ServerToolHandler extends BaseHandler {
           files_committed: 0,
           pushed: false,
         };
-        this.logSuccess('sync_storage', result, context);
+        await this.logSuccessAsync('sync_storage', result, context);
         return this.formatSuccessResponse(result);
       }
 
@@ -396,7 +396,7 @@ export class ServerToolHandler extends BaseHandler {
         commit_message: commitMessage,
       };
 
-      this.logSuccess('sync_storage', { files_committed: filesCount, pushed }, context);
+      await this.logSuccessAsync('sync_storage', { files_committed: filesCount, pushed }, context);
       return this.formatSuccessResponse(result);
     } catch (error) {
       const mcpError = new MCPError(
@@ -404,7 +404,7 @@ export class ServerToolHandler extends BaseHandler {
         `Failed to sync storage: ${error instanceof Error ? error.message : String(error)}`,
         { traceId: context.traceId }
       );
-      this.logError('sync_storage', {}, mcpError, context);
+      await this.logErrorAsync('sync_storage', {}, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -11,10 +11,10 @@ import { access, mkdir, readFile, writeFile, readdir, unlink, rm } from 'fs/prom
 import { join } from 'path';
 
 import fm from 'front-matter';
-import * as yaml from 'js-yaml';
 import slugify from 'slugify';
 import type { z } from 'zod';
 
+import { serializeDocument } from '../documents.js';
 import { MCPError, MCPErrorCode } from '../errors/index.js';
 import type {
   secureProjectIdSchema,
@@ -640,8 +640,7 @@ export class TodoToolHandler extends BaseHandler {
       updated: new Date().toISOString(),
     };
 
-    const frontmatter = yaml.dump(metadata);
-    const fullContent = `---\n${frontmatter}---\n\n# ${title}\n\n${content ?? ''}`;
+    const fullContent = serializeDocument(metadata, `\n# ${title}\n\n${content ?? ''}`);
 
     writeFileSync(join(todoDir, filename), fullContent);
     return filename;
@@ -680,8 +679,7 @@ export class TodoToolHandler extends BaseHandler {
     metadata.completed = completed;
     metadata.updated = new Date().toISOString();
 
-    const frontmatter = yaml.dump(metadata);
-    const updatedContent = `---\n${frontmatter}---\n${parsed.body}`;
+    const updatedContent = serializeDocument(metadata, parsed.body);
     writeFileSync(filepath, updatedContent);
   }
 
@@ -708,7 +706,7 @@ export class TodoToolHandler extends BaseHandler {
 
       // Project doesn't exist - return empty list without creating ghost entry
       if (!projectInfo) {
-        this.logSuccess('list_todos', { project_id }, context);
+        await this.logSuccessAsync('list_todos', { project_id }, context);
         return this.formatSuccessResponse({ todos: [] });
       }
 
@@ -719,7 +717,7 @@ export class TodoToolHandler extends BaseHandler {
       try {
         await access(todoPath);
       } catch {
-        this.logSuccess('list_todos', { project_id }, context);
+        await this.logSuccessAsync('list_todos', { project_id }, context);
         return this.formatSuccessResponse({ todos: [] });
       }
 
@@ -768,7 +766,7 @@ export class TodoToolHandler extends BaseHandler {
       // Sort by number ascending
       todos.sort((a, b) => a.number - b.number);
 
-      this.logSuccess('list_todos', { project_id, count: todos.length }, context);
+      await this.logSuccessAsync('list_todos', { project_id, count: todos.length }, context);
       return this.formatSuccessResponse({ todos });
     } catch (error) {
       const mcpError =
@@ -779,7 +777,7 @@ export class TodoToolHandler extends BaseHandler {
               `Failed to list TODOs: ${error instanceof Error ? error.message : String(error)}`,
               { project_id: params.project_id, traceId: context.traceId }
             );
-      this.logError('list_todos', params, mcpError, context);
+      await this.logErrorAsync('list_todos', params, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -828,15 +826,17 @@ export class TodoToolHandler extends BaseHandler {
           updated: new Date().toISOString(),
         };
 
-        const frontmatter = yaml.dump(taskMetadata);
-        const taskContent = `---\n${frontmatter}---\n\n# ${task.title}\n\n${task.content ?? ''}`;
+        const taskContent = serializeDocument(
+          taskMetadata,
+          `\n# ${task.title}\n\n${task.content ?? ''}`
+        );
         await writeFile(join(todoDir, taskFilename), taskContent);
       }
 
       // Auto-commit
       await autoCommitAsync(this.storagePath, `Create TODO #${todoNumber} in ${originalId}`);
 
-      this.logSuccess('create_todo', { project_id, todo_number: todoNumber }, context);
+      await this.logSuccessAsync('create_todo', { project_id, todo_number: todoNumber }, context);
       return this.formatSuccessResponse({
         todo_number: todoNumber,
         message:
@@ -853,7 +853,7 @@ export class TodoToolHandler extends BaseHandler {
               `Failed to create TODO: ${error instanceof Error ? error.message : String(error)}`,
               { project_id: params.project_id, traceId: context.traceId }
             );
-      this.logError('create_todo', params, mcpError, context);
+      await this.logErrorAsync('create_todo', params, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -897,14 +897,13 @@ export class TodoToolHandler extends BaseHandler {
       };
 
       // Write task file
-      const frontmatter = yaml.dump(metadata);
-      const taskContent = `---\n${frontmatter}---\n\n# ${title}\n\n${content || ''}`;
+      const taskContent = serializeDocument(metadata, `\n# ${title}\n\n${content || ''}`);
       await writeFile(join(todoDir, taskFilename), taskContent);
 
       // Auto-commit
       await autoCommitAsync(this.storagePath, `Add task "${title}" to TODO #${todo_number}`);
 
-      this.logSuccess(
+      await this.logSuccessAsync(
         'add_todo_task',
         { project_id, todo_number, task_number: taskNumber },
         context
@@ -926,7 +925,7 @@ export class TodoToolHandler extends BaseHandler {
                 traceId: context.traceId,
               }
             );
-      this.logError('add_todo_task', params, mcpError, context);
+      await this.logErrorAsync('add_todo_task', params, mcpError, context);
       return this.formatErrorResponse(mcpError, context);
     }
   }
@@ -985,12 +984,12 @@ export class TodoToolHandler extends BaseHandler {
         `Remove task #${task_number} from TODO #${todo_number}`
       );
 
-      this.logSuccess('remove_todo_task', params, context);
+      await this.logSuccessAsync('remove_todo_task', params, context);
       return this.formatSuccessResponse({
         message: `Removed task #${task_number} from TODO #${todo_number}`,
       });
     } catch (error) {
-      this.logError('remove_todo_task', params, error as MCPError, context);
+      await this.logErrorAsync('remove_todo_task', params, error as MCPError, context);
       return this.formatErrorResponse(error, context);
     }
   }
@@ -1049,12 +1048,12 @@ export class TodoToolHandler extends BaseHandler {
         `Complete task #${task_number} in TODO #${todo_number}`
       );
 
-      this.logSuccess('complete_todo_task', params, context);
+      await this.logSuccessAsync('complete_todo_task', params, context);
       return this.formatSuccessResponse({
         message: `Marked task #${task_number} as completed in TODO #${todo_number}`,
       });
     } catch (error) {
-      this.logError('complete_todo_task', params, error as MCPError, context);
+      await this.logErrorAsync('complete_todo_task', params, error as MCPError, context);
       return this.formatErrorResponse(error, context);
     }
   }
@@ -1106,7 +1105,7 @@ export class TodoToolHandler extends BaseHandler {
           const taskNumber = this.extractTaskNumber(taskFile);
           const taskData = await this.parseTaskDataAsync(taskPath);
 
-          this.logSuccess(
+          await this.logSuccessAsync(
             'get_next_todo_task',
             { project_id, todo_number, task_number: taskNumber },
             context
@@ -1121,12 +1120,16 @@ export class TodoToolHandler extends BaseHandler {
       }
 
       // No incomplete tasks
-      this.logSuccess('get_next_todo_task', { project_id, todo_number, found: false }, context);
+      await this.logSuccessAsync(
+        'get_next_todo_task',
+        { project_id, todo_number, found: false },
+        context
+      );
       return this.formatSuccessResponse({
         message: 'All tasks completed',
       });
     } catch (error) {
-      this.logError('get_next_todo_task', params, error as MCPError, context);
+      await this.logErrorAsync('get_next_todo_task', params, error as MCPError, context);
       return this.formatErrorResponse(error, context);
     }
   }
@@ -1191,7 +1194,7 @@ export class TodoToolHandler extends BaseHandler {
 
       const completedCount = tasks.filter((t) => t.completed).length;
 
-      this.logSuccess(
+      await this.logSuccessAsync(
         'get_todo_tasks',
         { project_id, todo_number, task_count: tasks.length },
         context
@@ -1208,7 +1211,7 @@ export class TodoToolHandler extends BaseHandler {
         tasks,
       });
     } catch (error) {
-      this.logError('get_todo_tasks', params, error as MCPError, context);
+      await this.logErrorAsync('get_todo_tasks', params, error as MCPError, context);
       return this.formatErrorResponse(error, context);
     }
   }
@@ -1253,12 +1256,12 @@ export class TodoToolHandler extends BaseHandler {
       // Auto-commit
       await autoCommitAsync(this.storagePath, `Delete TODO #${todo_number} from ${originalId}`);
 
-      this.logSuccess('delete_todo', params, context);
+      await this.logSuccessAsync('delete_todo', params, context);
       return this.formatSuccessResponse({
         message: `Deleted TODO #${todo_number}`,
       });
     } catch (error) {
-      this.logError('delete_todo', params, error as MCPError, context);
+      await this.logErrorAsync('delete_todo', params, error as MCPError, context);
       return this.formatErrorResponse(error, context);
     }
   }
@@ -1336,8 +1339,7 @@ export class TodoToolHandler extends BaseHandler {
     };
 
     // Write back with updated metadata
-    const frontmatter = yaml.dump(updatedMetadata);
-    const updatedContent = `---\n${frontmatter}---\n${parsed.body}`;
+    const updatedContent = serializeDocument(updatedMetadata, parsed.body);
     await writeFile(filepath, updatedContent);
   }
 
@@ -1,25 +1,48 @@
-import { execSync } from 'child_process';
+import { execFileSync } from 'child_process';
 import { basename } from 'path';
 import { cwd } from 'process';
 
 import { slugify } from './utils.js';
 
+// Remote origin URL per working directory; git config is only read once per directory
+const gitRemoteUrlCache = new Map<string, string | null>();
+
 /**
  * Extract git remote origin URL from current directory.
  * Returns the git remote origin URL if found, null otherwise.
  */
 export function getGitRemoteUrl(): string | null {
+  const currentDir = cwd();
+  const cached = gitRemoteUrlCache.get(currentDir);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  let remoteUrl: string | null;
   try {
-    const result = execSync('git config --get remote.origin.url', {
+    // Run git directly; going through a shell would start a second process
+    const result = execFileSync('git', ['config', '--get', 'remote.origin.url'], {
       encoding: 'utf8',
-      stdio: ['pipe', 'pipe', 'ignore'],
+      stdio: ['ignore', 'pipe', 'ignore'],
     }).trim();
 
-    return result || null;
+    remoteUrl = result || null;
   } catch {
     // Git not installed or other error
-    return null;
+    remoteUrl = null;
   }
+
+  gitRemoteUrlCache.set(currentDir, remoteUrl);
+  return remoteUrl;
+}
+
+/**
+ * Forget cached remote URLs, e.g. after the git configuration changed.
+ * Lookups are otherwise cached for the life of the process, a missing
+ * remote included.
+ */
+export function clearGitRemoteUrlCache(): void {
+  gitRemoteUrlCache.clear();
 }
 
 /**
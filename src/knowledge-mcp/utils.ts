@@ -1,4 +1,4 @@
-import { execSync, spawnSync, spawn, exec as execCallback } from 'child_process';
+import { spawnSync, spawn } from 'child_process';
 import {
   existsSync,
   mkdirSync,
@@ -11,7 +11,9 @@ import {
   lstatSync,
   rmSync,
   readdirSync,
+  statSync,
 } from 'fs';
+import type { BigIntStats } from 'fs';
 import {
   access,
   mkdir,
@@ -23,16 +25,14 @@ import {
   realpath,
   lstat,
   rm,
+  stat,
 } from 'fs/promises';
 import { join, resolve, isAbsolute, dirname, sep } from 'path';
-import { promisify } from 'util';
 
 import slugifyLib from 'slugify';
 
 import { logger } from './config/index.js';
 
-const exec = promisify(execCallback);
-
 // Enhanced file locking mechanism with proper queuing to prevent race conditions
 interface LockQueue {
   queue: Array<{
@@ -187,6 +187,20 @@ export interface ProjectIndex {
   projects: Record<string, string>;
 }
 
+// Windows drive letter prefix
+const DRIVE_LETTER = /^[A-Za-z]:/;
+// Anything validatePath rejects by character: drive letter, backslash or null byte
+const SUSPICIOUS_PATH = /^[A-Za-z]:|[\\\0]/;
+
+/**
+ * Whether a filesystem error means the path doesn't exist yet: ENOENT, or
+ * ENOTDIR when one of its parents is a file rather than a directory.
+ */
+function isNotYetCreated(error: unknown): boolean {
+  const code = (error as NodeJS.ErrnoException).code;
+  return code === 'ENOENT' || code === 'ENOTDIR';
+}
+
 /**
  * Validate that a requested path is within the base directory.
  * Prevents directory traversal attacks with comprehensive security checks.
@@ -206,18 +220,20 @@ export function validatePath(basePath: string, requestedPath: string): string {
     throw new Error('Invalid path: Absolute paths not allowed');
   }
 
-  // Check for Windows drive letters (more comprehensive)
-  if (/^[A-Za-z]:/.test(requestedPath)) {
-    throw new Error('Invalid path: Drive letters not allowed');
-  }
+  // One scan rules out drive letters, backslashes and null bytes; the
+  // separate checks only run to report which one was found
+  if (SUSPICIOUS_PATH.test(requestedPath)) {
+    // Check for Windows drive letters (more comprehensive)
+    if (DRIVE_LETTER.test(requestedPath)) {
+      throw new Error('Invalid path: Drive letters not allowed');
+    }
 
-  // Check for backslashes (Windows paths) and other suspicious characters
-  if (requestedPath.includes('\\')) {
-    throw new Error('Invalid path: Backslashes not allowed');
-  }
+    // Check for backslashes (Windows paths) and other suspicious characters
+    if (requestedPath.includes('\\')) {
+      throw new Error('Invalid path: Backslashes not allowed');
+    }
 
-  // Check for null bytes (security vulnerability)
-  if (requestedPath.includes('\0')) {
+    // Check for null bytes (security vulnerability)
     throw new Error('Invalid path: Null bytes not allowed');
   }
 
@@ -242,50 +258,50 @@ export function validatePath(basePath: string, requestedPath: string): string {
   }
 
   // Enhanced symlink security check
-  if (existsSync(resolvedPath)) {
-    try {
-      // Get real path resolving all symlinks
-      const realPath = realpathSync(resolvedPath);
+  try {
+    // Get real path resolving all symlinks; this fails with ENOENT or ENOTDIR
+    // for paths that don't exist, so no separate existence check is needed
+    const realPath = realpathSync.native(resolvedPath);
 
-      // Ensure the real path is still within the base directory
-      if (!realPath.startsWith(normalizedBase + sep) && realPath !== normalizedBase) {
-        throw new Error('Invalid path: Symlink points outside allowed directory');
-      }
+    // Ensure the real path is still within the base directory
+    if (!realPath.startsWith(normalizedBase + sep) && realPath !== normalizedBase) {
+      throw new Error('Invalid path: Symlink points outside allowed directory');
+    }
 
-      // Check each component in the path for symlinks that could escape
-      let currentPath = resolvedPath;
-      while (currentPath !== normalizedBase) {
-        if (existsSync(currentPath)) {
-          const stats = lstatSync(currentPath);
-          if (stats.isSymbolicLink()) {
-            const linkTarget = readlinkSync(currentPath);
-            const absoluteLinkTarget = isAbsolute(linkTarget)
-              ? linkTarget
-              : resolve(dirname(currentPath), linkTarget);
-
-            if (
-              !absoluteLinkTarget.startsWith(normalizedBase + sep) &&
-              absoluteLinkTarget !== normalizedBase
-            ) {
-              throw new Error('Invalid path: Symlink component points outside allowed directory');
-            }
-          }
+    // Check each component in the path for symlinks that could escape
+    let currentPath = resolvedPath;
+    while (currentPath !== normalizedBase) {
+      // One lstat tells both whether the component exists and whether it is a link
+      const stats = lstatSync(currentPath, { throwIfNoEntry: false });
+      if (stats?.isSymbolicLink()) {
+        const linkTarget = readlinkSync(currentPath);
+        const absoluteLinkTarget = isAbsolute(linkTarget)
+          ? linkTarget
+          : resolve(dirname(currentPath), linkTarget);
+
+        if (
+          !absoluteLinkTarget.startsWith(normalizedBase + sep) &&
+          absoluteLinkTarget !== normalizedBase
+        ) {
+          throw new Error('Invalid path: Symlink component points outside allowed directory');
         }
-        currentPath = dirname(currentPath);
       }
+      currentPath = dirname(currentPath);
+    }
 
-      return realPath;
-    } catch (error) {
-      if (error instanceof Error && error.message.includes('Invalid path:')) {
-        throw error; // Re-throw our security errors
-      }
-      throw new Error(
-        `Invalid path: Security check failed - ${error instanceof Error ? error.message : String(error)}`
-      );
+    return realPath;
+  } catch (error) {
+    if (isNotYetCreated(error)) {
+      // File doesn't exist yet, which is ok for write operations
+      return resolvedPath;
+    }
+    if (error instanceof Error && error.message.includes('Invalid path:')) {
+      throw error; // Re-throw our security errors
     }
+    throw new Error(
+      `Invalid path: Security check failed - ${error instanceof Error ? error.message : String(error)}`
+    );
   }
-
-  return resolvedPath;
 }
 
 /**
@@ -308,18 +324,20 @@ export async function validatePathAsync(basePath: string, requestedPath: string)
     throw new Error('Invalid path: Absolute paths not allowed');
   }
 
-  // Check for Windows drive letters (more comprehensive)
-  if (/^[A-Za-z]:/.test(requestedPath)) {
-    throw new Error('Invalid path: Drive letters not allowed');
-  }
+  // One scan rules out drive letters, backslashes and null bytes; the
+  // separate checks only run to report which one was found
+  if (SUSPICIOUS_PATH.test(requestedPath)) {
+    // Check for Windows drive letters (more comprehensive)
+    if (DRIVE_LETTER.test(requestedPath)) {
+      throw new Error('Invalid path: Drive letters not allowed');
+    }
 
-  // Check for backslashes (Windows paths) and other suspicious characters
-  if (requestedPath.includes('\\')) {
-    throw new Error('Invalid path: Backslashes not allowed');
-  }
+    // Check for backslashes (Windows paths) and other suspicious characters
+    if (requestedPath.includes('\\')) {
+      throw new Error('Invalid path: Backslashes not allowed');
+    }
 
-  // Check for null bytes (security vulnerability)
-  if (requestedPath.includes('\0')) {
+    // Check for null bytes (security vulnerability)
     throw new Error('Invalid path: Null bytes not allowed');
   }
 
@@ -345,9 +363,8 @@ export async function validatePathAsync(basePath: string, requestedPath: string)
 
   // Enhanced symlink security check
   try {
-    await access(resolvedPath);
-
-    // Get real path resolving all symlinks
+    // Get real path resolving all symlinks; this fails with ENOENT or ENOTDIR
+    // for paths that don't exist, so no separate existence check is needed
     const realPath = await realpath(resolvedPath);
 
     // Ensure the real path is still within the base directory
@@ -359,7 +376,7 @@ export async function validatePathAsync(basePath: string, requestedPath: string)
     let currentPath = resolvedPath;
     while (currentPath !== normalizedBase) {
       try {
-        await access(currentPath);
+        // lstat fails with ENOENT itself, no separate access check needed
         const stats = await lstat(currentPath);
         if (stats.isSymbolicLink()) {
           const linkTarget = await readlink(currentPath);
@@ -376,7 +393,7 @@ export async function validatePathAsync(basePath: string, requestedPath: string)
         }
       } catch (error) {
         // File doesn't exist yet, which is ok for write operations
-        if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+        if (!isNotYetCreated(error)) {
           throw error;
         }
       }
@@ -385,7 +402,7 @@ export async function validatePathAsync(basePath: string, requestedPath: string)
 
     return realPath;
   } catch (error) {
-    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+    if (isNotYetCreated(error)) {
       // File doesn't exist yet, which is ok for write operations
       return resolvedPath;
     }
@@ -398,33 +415,103 @@ export async function validatePathAsync(basePath: string, requestedPath: string)
   }
 }
 
+// Text that slugifyLib has nothing to transliterate or strip in
+const SIMPLE_SLUG_INPUT = /^[A-Za-z0-9 _-]*$/;
+
+// slugify patterns, compiled once at load rather than on every call
+const PATH_SEPARATORS = /[/\\]/g;
+const PARENT_DIRECTORY = /\.\./g;
+const DOT_BETWEEN_UNDERSCORES = /_\._/g;
+const DOT_BEFORE_UNDERSCORE = /\._/g;
+const DOT_AFTER_UNDERSCORE = /_\./g;
+const UNDERSCORE_RUNS = /_{2,}/g;
+const EDGE_UNDERSCORES = /^_+|_+$/g;
+const UNDERSCORES_AND_DOTS = /[_.]/g;
+
+/**
+ * Slug text matching SIMPLE_SLUG_INPUT exactly like slugifyLib does with
+ * lower, strict and '-' replacement: hyphens count as spaces, strict mode
+ * drops underscores, and whitespace runs become single hyphens.
+ */
+function simpleSlug(text: string): string {
+  // One pass: separators are held back until a character follows them,
+  // which trims both ends and collapses runs
+  let slug = '';
+  let separatorPending = false;
+  for (let i = 0; i < text.length; i++) {
+    const code = text.charCodeAt(i);
+    if (code === 0x5f) {
+      continue;
+    }
+    if (code === 0x20 || code === 0x2d) {
+      separatorPending = slug.length > 0;
+      continue;
+    }
+    if (separatorPending) {
+      slug += '-';
+      separatorPending = false;
+    }
+    // SIMPLE_SLUG_INPUT leaves only ASCII letters and digits here
+    slug += String.fromCharCode(code >= 0x41 && code <= 0x5a ? code + 0x20 : code);
+  }
+  return slug;
+}
+
+// Slugs of recently seen names, in least-recently-used order
+const SLUG_CACHE_SIZE = 1024;
+const slugCache = new Map<string, string>();
+
 /**
  * Convert text to a safe slug.
  */
 export function slugify(text: string): string {
+  const cached = slugCache.get(text);
+  if (cached !== undefined) {
+    // Re-insert to mark as most recently used
+    slugCache.delete(text);
+    slugCache.set(text, cached);
+    return cached;
+  }
+
+  const slug = computeSlug(text);
+  slugCache.set(text, slug);
+  if (slugCache.size > SLUG_CACHE_SIZE) {
+    const oldest = slugCache.keys().next().value;
+    if (oldest !== undefined) {
+      slugCache.delete(oldest);
+    }
+  }
+  return slug;
+}
+
+/**
+ * Slug computation behind slugify's cache.
+ */
+function computeSlug(text: string): string {
   if (!text?.trim()) {
     return 'untitled';
   }
 
   // Remove path separators first to handle path traversal attempts
-  let processed = text.replace(/[/\\]/g, '_');
+  let processed = text.replace(PATH_SEPARATORS, '_');
 
   // Remove directory traversal patterns for security
-  processed = processed.replace(/\.\./g, '');
+  processed = processed.replace(PARENT_DIRECTORY, '');
 
   // Handle single dots used as directory separators
-  processed = processed.replace(/_\._/g, '_').replace(/\._/g, '_').replace(/_\./g, '_');
+  processed = processed
+    .replace(DOT_BETWEEN_UNDERSCORES, '_')
+    .replace(DOT_BEFORE_UNDERSCORE, '_')
+    .replace(DOT_AFTER_UNDERSCORE, '_');
 
   // Collapse multiple underscores
-  while (processed.includes('__')) {
-    processed = processed.replace(/__/g, '_');
-  }
+  processed = processed.replace(UNDERSCORE_RUNS, '_');
 
   // Remove leading/trailing underscores
-  processed = processed.replace(/^_+|_+$/g, '');
+  processed = processed.replace(EDGE_UNDERSCORES, '');
 
   // Check if text became empty
-  if (!processed || processed.replace(/[_.]/g, '') === '') {
+  if (!processed || processed.replace(UNDERSCORES_AND_DOTS, '') === '') {
     return 'untitled';
   }
 
@@ -436,18 +523,29 @@ export function slugify(text: string): string {
     processed = processed.slice(0, lastDotIndex);
   }
 
-  // Use slugify library with custom options
-  const slugified = slugifyLib(processed, {
-    lower: true,
-    strict: true,
-    replacement: '-',
-  });
+  // Use slugify library with custom options; plain ASCII names skip its
+  // per-character transliteration pass
+  const slugified = SIMPLE_SLUG_INPUT.test(processed)
+    ? simpleSlug(processed)
+    : slugifyLib(processed, {
+        lower: true,
+        strict: true,
+        replacement: '-',
+      });
 
   // Reattach extension if it was present
   const result = extension ? `${slugified}${extension}` : slugified;
   return result || 'untitled';
 }
 
+// Identity every git command runs with, independent of the user's git config
+const GIT_IDENTITY_ARGS: readonly string[] = [
+  '-c',
+  'user.name=Knowledge MCP Server',
+  '-c',
+  'user.email=knowledge-mcp@localhost',
+];
+
 /**
  * Execute a git command with isolated credentials and secure argument handling.
  * Prevents command injection by using execSync with argument array instead of shell string.
@@ -488,19 +586,13 @@ export function gitCommand(
   }
 
   // Build secure command array with git configuration
-  const gitArgs = [
-    '-c',
-    'user.name=Knowledge MCP Server',
-    '-c',
-    'user.email=knowledge-mcp@localhost',
-    ...args,
-  ];
+  const gitArgs = [...GIT_IDENTITY_ARGS, ...args];
 
   // Use spawnSync for safer argument handling
   const result = spawnSync('git', gitArgs, {
     cwd: repoPath,
     encoding: 'utf8',
-    stdio: ['pipe', 'pipe', 'pipe'],
+    stdio: ['ignore', 'pipe', 'pipe'],
   });
 
   if (result.error) {
@@ -540,23 +632,19 @@ export function initializeStorage(storagePath: string): void {
     return;
   }
 
-  // Initialize git repository
-  execSync('git init', { cwd: storagePath });
+  // Initialize git repository without a shell in between
+  gitCommand(storagePath, 'init');
 
-  // Create initial commit if repository is empty
-  try {
-    execSync('git rev-parse HEAD', { cwd: storagePath, stdio: 'ignore' });
-  } catch {
-    // No commits yet, create initial commit
-    const readmePath = join(storagePath, 'README.md');
-    writeFileSync(
-      readmePath,
-      '# Knowledge MCP Storage\n\nThis directory contains project knowledge managed by Knowledge MCP Server.\n'
-    );
+  // A repository that git init just created has no commits yet, so the
+  // initial commit is created without asking rev-parse first
+  const readmePath = join(storagePath, 'README.md');
+  writeFileSync(
+    readmePath,
+    '# Knowledge MCP Storage\n\nThis directory contains project knowledge managed by Knowledge MCP Server.\n'
+  );
 
-    gitCommand(storagePath, 'add', 'README.md');
-    gitCommand(storagePath, 'commit', '-m', 'Initial commit');
-  }
+  gitCommand(storagePath, 'add', 'README.md');
+  gitCommand(storagePath, 'commit', '-m', 'Initial commit');
 }
 
 /**
@@ -613,6 +701,19 @@ export function pullFromOrigin(repoPath: string): void {
   }
 }
 
+/**
+ * Check whether the index differs from HEAD.
+ */
+function hasStagedChanges(repoPath: string): boolean {
+  try {
+    // Exits non-zero when there are differences
+    gitCommand(repoPath, 'diff', '--cached', '--quiet');
+    return false;
+  } catch {
+    return true;
+  }
+}
+
 /**
  * Automatically commit all changes in the repository.
  */
@@ -621,17 +722,20 @@ export function autoCommit(repoPath: string, message: string): void {
     // Stage all changes
     gitCommand(repoPath, 'add', '-A');
 
-    // Check if there are changes to commit
-    const { stdout } = gitCommand(repoPath, 'status', '--porcelain');
-
-    if (stdout.trim()) {
-      // Commit changes
+    // Commit directly; git refuses when nothing is staged, and only then is
+    // the index checked, so the usual case costs no separate status call
+    try {
       gitCommand(repoPath, 'commit', '-m', message);
-
-      // Push to origin if it exists
-      if (hasGitRemote(repoPath)) {
-        pushToOrigin(repoPath);
+    } catch (error) {
+      if (!hasStagedChanges(repoPath)) {
+        return;
       }
+      throw error;
+    }
+
+    // Push to origin if it exists
+    if (hasGitRemote(repoPath)) {
+      pushToOrigin(repoPath);
     }
   } catch (error) {
     // Log error but don't fail the operation
@@ -641,24 +745,76 @@ export function autoCommit(repoPath: string, message: string): void {
   }
 }
 
+interface ProjectIndexCache {
+  // Identity of the index.json the entries were read from
+  mtimeNs: bigint;
+  size: bigint;
+  // Parsed index, filled on first read
+  projects: Record<string, string> | null;
+  // Resolved project directories
+  directories: Map<string, string>;
+}
+
+// Index contents per storage path
+const projectIndexCaches = new Map<string, ProjectIndexCache>();
+
+/**
+ * Get the index cache for a storage path, discarding it when index.json has
+ * changed since it was filled - also by other processes sharing the storage.
+ */
+function getProjectIndexCache(storagePath: string, stats: BigIntStats): ProjectIndexCache {
+  let cache = projectIndexCaches.get(storagePath);
+  if (!cache || cache.mtimeNs !== stats.mtimeNs || cache.size !== stats.size) {
+    cache = { mtimeNs: stats.mtimeNs, size: stats.size, projects: null, directories: new Map() };
+    projectIndexCaches.set(storagePath, cache);
+  }
+  return cache;
+}
+
+/**
+ * Extract the project mapping from index.json content.
+ */
+function parseProjectIndex(content: string): Record<string, string> {
+  const data = JSON.parse(content) as ProjectIndex;
+  return data.projects && typeof data.projects === 'object' ? data.projects : {};
+}
+
+/**
+ * Read the project index through the cache. The result is shared with the
+ * cache and must not be mutated.
+ */
+function readCachedProjectIndex(
+  cache: ProjectIndexCache,
+  indexFile: string
+): Record<string, string> {
+  if (!cache.projects) {
+    try {
+      cache.projects = parseProjectIndex(readFileSync(indexFile, 'utf8'));
+    } catch {
+      // If index is corrupted, return empty dict
+      return {};
+    }
+  }
+  return cache.projects;
+}
+
 /**
  * Read the project index mapping original names to slugified directories.
+ * While index.json is unchanged this costs one stat.
  */
 export function readProjectIndex(storagePath: string): Record<string, string> {
   const indexFile = join(storagePath, 'index.json');
 
-  if (!existsSync(indexFile)) {
-    return {};
-  }
-
+  let stats: BigIntStats;
   try {
-    const content = readFileSync(indexFile, 'utf8');
-    const data = JSON.parse(content) as ProjectIndex;
-    return data.projects && typeof data.projects === 'object' ? data.projects : {};
+    stats = statSync(indexFile, { bigint: true });
   } catch {
-    // If index is corrupted, return empty dict
+    // If index doesn't exist, return empty dict
     return {};
   }
+
+  // Copy, since callers update the index they read
+  return { ...readCachedProjectIndex(getProjectIndexCache(storagePath, stats), indexFile) };
 }
 
 /**
@@ -675,6 +831,7 @@ export function writeProjectIndex(storagePath: string, index: Record<string, str
 
       // Atomic rename
       renameSync(tempFile, indexFile);
+      projectIndexCaches.delete(storagePath);
 
       // Commit the index change
       autoCommit(storagePath, 'Update project index');
@@ -714,12 +871,30 @@ export function getProjectDirectory(
   storagePath: string,
   projectId: string
 ): [string, string] | null {
-  const index = readProjectIndex(storagePath);
+  const indexFile = join(storagePath, 'index.json');
+  let stats: BigIntStats;
+  try {
+    stats = statSync(indexFile, { bigint: true });
+  } catch {
+    // No readable index means no projects
+    return null;
+  }
+
+  // While the index is unchanged, known projects cost one stat
+  const cache = getProjectIndexCache(storagePath, stats);
+  const cachedPath = cache.directories.get(projectId);
+  if (cachedPath !== undefined) {
+    return [projectId, cachedPath];
+  }
+
+  const index = readCachedProjectIndex(cache, indexFile);
 
   // Check if project_id is already in index
   if (projectId in index) {
     const dirName = index[projectId];
-    return [projectId, join(storagePath, 'projects', dirName)];
+    const projectPath = join(storagePath, 'projects', dirName);
+    cache.directories.set(projectId, projectPath);
+    return [projectId, projectPath];
   }
 
   // Project doesn't exist - return null instead of creating entry
@@ -743,10 +918,12 @@ export function createProjectEntry(storagePath: string, projectId: string): [str
   // For new projects, create mapping
   let slugified = slugify(projectId);
 
-  // Ensure unique directory name
+  // Ensure unique directory name; names in use are collected once so each
+  // candidate is a set lookup instead of a scan of the index
+  const usedNames = new Set(Object.values(index));
   const baseSlug = slugified;
   let counter = 1;
-  while (Object.values(index).includes(slugified)) {
+  while (usedNames.has(slugified)) {
     slugified = `${baseSlug}-${counter}`;
     counter++;
   }
@@ -984,6 +1161,19 @@ Thumbs.db
 export async function gitCommandAsync(
   repoPath: string,
   ...args: string[]
+): Promise<{ stdout: string; stderr: string }> {
+  return runGitCommandAsync(repoPath, args);
+}
+
+/**
+ * Run a validated git command, optionally writing input to its stdin.
+ * Text passed on stdin never becomes an argument, so it is not subject to
+ * the argument checks (used for multi-line commit messages).
+ */
+async function runGitCommandAsync(
+  repoPath: string,
+  args: string[],
+  input?: string
 ): Promise<{ stdout: string; stderr: string }> {
   // Validate repository path
   if (!repoPath || typeof repoPath !== 'string') {
@@ -1017,33 +1207,36 @@ export async function gitCommandAsync(
   }
 
   // Build secure command array with git configuration
-  const gitArgs = [
-    '-c',
-    'user.name=Knowledge MCP Server',
-    '-c',
-    'user.email=knowledge-mcp@localhost',
-    ...args,
-  ];
+  const gitArgs = [...GIT_IDENTITY_ARGS, ...args];
 
   return new Promise((resolve, reject) => {
     // Use spawn for safer argument handling (consistent with sync version)
     const child = spawn('git', gitArgs, {
       cwd: repoPath,
-      stdio: ['pipe', 'pipe', 'pipe'],
+      stdio: [input === undefined ? 'ignore' : 'pipe', 'pipe', 'pipe'],
     });
+    if (input !== undefined) {
+      // A git that exits before reading reports the failure by exit code
+      child.stdin?.on('error', () => undefined);
+      child.stdin?.end(input, 'utf8');
+    }
 
-    let stdout = '';
-    let stderr = '';
+    // Keep raw chunks and decode once at exit, so multi-byte characters
+    // split across chunks stay intact
+    const stdoutChunks: Buffer[] = [];
+    const stderrChunks: Buffer[] = [];
 
     child.stdout?.on('data', (data: Buffer) => {
-      stdout += data.toString();
+      stdoutChunks.push(data);
     });
 
     child.stderr?.on('data', (data: Buffer) => {
-      stderr += data.toString();
+      stderrChunks.push(data);
     });
 
     child.on('close', (code: number) => {
+      const stdout = Buffer.concat(stdoutChunks).toString('utf8');
+      const stderr = Buffer.concat(stderrChunks).toString('utf8');
       if (code !== 0) {
         reject(
           new Error(`Git command failed with exit code ${code}: ${stderr || 'Unknown error'}`)
@@ -1086,23 +1279,18 @@ export async function initializeStorageAsync(storagePath: string): Promise<void>
     return;
   }
 
-  // Initialize git repository
-  await exec('git init', { cwd: storagePath });
+  // Initialize git repository without a shell in between
+  await gitCommandAsync(storagePath, 'init');
 
-  // Create initial commit if repository is empty
-  try {
-    await exec('git rev-parse HEAD', { cwd: storagePath });
-  } catch {
-    // No commits yet, create initial commit
-    const readmePath = join(storagePath, 'README.md');
-    await writeFile(
-      readmePath,
-      '# Knowledge MCP Storage\n\nThis directory contains project knowledge managed by Knowledge MCP Server.\n'
-    );
+  // A repository that git init just created has no commits yet
+  const readmePath = join(storagePath, 'README.md');
+  await writeFile(
+    readmePath,
+    '# Knowledge MCP Storage\n\nThis directory contains project knowledge managed by Knowledge MCP Server.\n'
+  );
 
-    await gitCommandAsync(storagePath, 'add', 'README.md');
-    await gitCommandAsync(storagePath, 'commit', '-m', 'Initial commit');
-  }
+  await gitCommandAsync(storagePath, 'add', 'README.md');
+  await gitCommandAsync(storagePath, 'commit', '-m', 'Initial commit');
 }
 
 /**
@@ -1162,26 +1350,101 @@ export async function pullFromOriginAsync(repoPath: string): Promise<void> {
   }
 }
 
+interface AutoCommitBatch {
+  messages: string[];
+  done: Promise<void>;
+}
+
+interface AutoCommitQueue {
+  // Settles when the most recently queued batch has been committed
+  tail: Promise<void>;
+  // Batch that has not started yet and still accepts messages
+  waiting: AutoCommitBatch | null;
+}
+
+// Per-repository commit queues
+const autoCommitQueues = new Map<string, AutoCommitQueue>();
+
 /**
  * Async version of autoCommit.
  * Automatically commit all changes in the repository.
+ *
+ * Calls made while a commit is already running are coalesced: they share one
+ * follow-up commit instead of each running add/commit/push. Every
+ * returned promise settles only once a commit covering the caller's changes
+ * has finished, so sequential callers see no delay.
  */
-export async function autoCommitAsync(repoPath: string, message: string): Promise<void> {
+export function autoCommitAsync(repoPath: string, message: string): Promise<void> {
+  let queue = autoCommitQueues.get(repoPath);
+  if (!queue) {
+    queue = { tail: Promise.resolve(), waiting: null };
+    autoCommitQueues.set(repoPath, queue);
+  }
+
+  if (queue.waiting) {
+    queue.waiting.messages.push(message);
+    return queue.waiting.done;
+  }
+
+  const currentQueue = queue;
+  const batch: AutoCommitBatch = { messages: [message], done: Promise.resolve() };
+  batch.done = queue.tail
+    // A failed earlier batch was already reported to its own callers
+    .catch(() => undefined)
+    .finally(() => {
+      // Changes made from here on need a commit of their own
+      currentQueue.waiting = null;
+    })
+    .then(() => commitAllChangesAsync(repoPath, formatBatchCommitMessage(batch.messages)));
+  queue.waiting = batch;
+  queue.tail = batch.done;
+  return batch.done;
+}
+
+/**
+ * Combine the messages of coalesced auto-commits into one commit message.
+ */
+function formatBatchCommitMessage(messages: string[]): string {
+  if (messages.length === 1) {
+    return messages[0];
+  }
+  return `Batch update: ${messages.length} changes\n\n${messages.map((m) => `- ${m}`).join('\n')}`;
+}
+
+/**
+ * Async version of hasStagedChanges.
+ */
+async function hasStagedChangesAsync(repoPath: string): Promise<boolean> {
+  try {
+    await gitCommandAsync(repoPath, 'diff', '--cached', '--quiet');
+    return false;
+  } catch {
+    return true;
+  }
+}
+
+/**
+ * Stage and commit all changes, then push if a remote is configured.
+ */
+async function commitAllChangesAsync(repoPath: string, message: string): Promise<void> {
   try {
     // Stage all changes
     await gitCommandAsync(repoPath, 'add', '-A');
 
-    // Check if there are changes to commit
-    const { stdout } = await gitCommandAsync(repoPath, 'status', '--porcelain');
-
-    if (stdout.trim()) {
-      // Commit changes
-      await gitCommandAsync(repoPath, 'commit', '-m', message);
-
-      // Push to origin if it exists
-      if (await hasGitRemoteAsync(repoPath)) {
-        await pushToOriginAsync(repoPath);
+    // Commit directly; the index is only checked when git refuses. The
+    // message goes through stdin because batched messages span several lines
+    try {
+      await runGitCommandAsync(repoPath, ['commit', '-F', '-'], message);
+    } catch (error) {
+      if (!(await hasStagedChangesAsync(repoPath))) {
+        return;
       }
+      throw error;
+    }
+
+    // Push to origin if it exists
+    if (await hasGitRemoteAsync(repoPath)) {
+      await pushToOriginAsync(repoPath);
     }
   } catch (error) {
     // Log error but don't fail the operation
@@ -1198,15 +1461,35 @@ export async function autoCommitAsync(repoPath: string, message: string): Promis
 export async function readProjectIndexAsync(storagePath: string): Promise<Record<string, string>> {
   const indexFile = join(storagePath, 'index.json');
 
+  let stats: BigIntStats;
   try {
-    await access(indexFile);
-    const content = await readFile(indexFile, 'utf8');
-    const data = JSON.parse(content) as ProjectIndex;
-    return data.projects && typeof data.projects === 'object' ? data.projects : {};
+    stats = await stat(indexFile, { bigint: true });
   } catch {
-    // If index doesn't exist or is corrupted, return empty dict
+    // If index doesn't exist, return empty dict
     return {};
   }
+
+  // Copy, since callers update the index they read
+  const cache = getProjectIndexCache(storagePath, stats);
+  return { ...(await readCachedProjectIndexAsync(cache, indexFile)) };
+}
+
+/**
+ * Async version of readCachedProjectIndex.
+ */
+async function readCachedProjectIndexAsync(
+  cache: ProjectIndexCache,
+  indexFile: string
+): Promise<Record<string, string>> {
+  if (!cache.projects) {
+    try {
+      cache.projects = parseProjectIndex(await readFile(indexFile, 'utf8'));
+    } catch {
+      // If index is corrupted, return empty dict
+      return {};
+    }
+  }
+  return cache.projects;
 }
 
 /**
@@ -1226,6 +1509,7 @@ async function writeProjectIndexInternal(
 
     // Atomic rename
     await rename(tempFile, indexFile);
+    projectIndexCaches.delete(storagePath);
 
     // Commit the index change
     await autoCommitAsync(storagePath, 'Update project index');
@@ -1277,12 +1561,29 @@ export async function getProjectDirectoryAsync(
   storagePath: string,
   projectId: string
 ): Promise<[string, string] | null> {
+  const indexFile = join(storagePath, 'index.json');
+  let stats: BigIntStats;
+  try {
+    stats = await stat(indexFile, { bigint: true });
+  } catch {
+    // No readable index means no projects
+    return null;
+  }
+
+  // While the index is unchanged, known projects cost one stat
+  const cache = getProjectIndexCache(storagePath, stats);
+  const cachedPath = cache.directories.get(projectId);
+  if (cachedPath !== undefined) {
+    return [projectId, cachedPath];
+  }
+
   // Read current index
-  const index = await readProjectIndexAsync(storagePath);
+  const index = await readCachedProjectIndexAsync(cache, indexFile);
 
   // Check if we already have a directory for this project
   if (index[projectId]) {
     const projectPath = join(storagePath, 'projects', index[projectId]);
+    cache.directories.set(projectId, projectPath);
     return [projectId, projectPath];
   }
 
@@ -1314,7 +1615,8 @@ export async function createProjectEntryAsync(
     let counter = 1;
 
     // Handle collisions
-    while (Object.values(index).includes(dirName)) {
+    const usedNames = new Set(Object.values(index));
+    while (usedNames.has(dirName)) {
       dirName = `${slugifiedName}-${counter}`;
       counter++;
     }
@@ -1372,14 +1674,8 @@ export async function logActivityAsync(
     };
     const logLine = JSON.stringify(logEntry) + '\n';
 
-    // Check if file exists
-    try {
-      await access(logFile);
-      await writeFile(logFile, logLine, { flag: 'a' });
-    } catch {
-      // File doesn't exist, create it
-      await writeFile(logFile, logLine);
-    }
+    // Append mode creates the file if it doesn't exist yet
+    await writeFile(logFile, logLine, { flag: 'a' });
   } catch (error) {
     // Silently fail for logging errors
     console.error(
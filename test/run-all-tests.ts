@@ -335,7 +335,12 @@ function saveTestResults(
   console.log(`  Mochawesome: ${mochawesomePath}`);
 }
 
-async function runTestSuite(suitePath: string): Promise<TestSuiteResult> {
+/**
+ * Run one suite in its own tsx process. With streamOutput the suite's output
+ * is forwarded as it arrives; otherwise it is printed in one block once the
+ * suite has finished, so concurrent suites don't interleave.
+ */
+async function runTestSuite(suitePath: string, streamOutput = true): Promise<TestSuiteResult> {
   const suiteName = suitePath.split('/').pop() ?? 'unknown';
   const startTime = Date.now();
 
@@ -354,18 +359,33 @@ async function runTestSuite(suitePath: string): Promise<TestSuiteResult> {
     child.stdout?.on('data', (data: string | Buffer) => {
       const output = data.toString();
       stdout += output;
-      process.stdout.write(output);
+      if (streamOutput) {
+        process.stdout.write(output);
+      }
     });
 
     child.stderr?.on('data', (data: string | Buffer) => {
       const output = data.toString();
       stderr += output;
-      process.stderr.write(output);
+      if (streamOutput) {
+        process.stderr.write(output);
+      }
     });
 
     child.on('close', (code) => {
       const duration = Date.now() - startTime;
 
+      if (!streamOutput) {
+        // Blocks arrive in completion order, so each one names its suite
+        console.log('═'.repeat(60));
+        console.log(`📁 Suite ${suiteName}`);
+        console.log('═'.repeat(60));
+        process.stdout.write(stdout);
+        if (stderr) {
+          process.stderr.write(`[${suiteName}] stderr:\n${stderr}`);
+        }
+      }
+
       // Parse test results from output
       const totalMatch = stdout.match(/Total Tests: (\d+)/);
       const passedMatch = stdout.match(/Passed: (\d+)/);
@@ -448,31 +468,61 @@ async function main(): Promise<void> {
   });
   console.log();
 
-  // Run test suites sequentially
   const results: TestSuiteResult[] = [];
   const startTime = Date.now();
 
-  for (let i = 0; i < testFiles.length; i++) {
-    const file = testFiles[i];
-    const name = file.split('/').pop() ?? 'unknown';
-
-    console.log('═'.repeat(60));
-    console.log(`📁 Running suite ${i + 1}/${testFiles.length}: ${name}`);
-    console.log('═'.repeat(60));
-    console.log();
-
-    const result = await runTestSuite(file);
-    results.push(result);
-
-    if (!result.passed) {
-      console.log(`\n⚠️  Suite ${name} failed!`);
-      if (process.env.STOP_ON_FAILURE === 'true') {
-        console.log('Stopping test execution due to STOP_ON_FAILURE=true');
-        break;
+  // Every suite uses its own storage directory and server process, so they
+  // can run side by side when TEST_CONCURRENCY asks for it
+  const concurrency = Math.max(1, parseInt(process.env.TEST_CONCURRENCY ?? '1', 10) || 1);
+  if (concurrency > 1) {
+    console.log(`Running up to ${concurrency} suites at a time\n`);
+    const suiteResults: (TestSuiteResult | undefined)[] = new Array(testFiles.length);
+    let nextSuite = 0;
+    let stopped = false;
+    const worker = async (): Promise<void> => {
+      while (!stopped && nextSuite < testFiles.length) {
+        const index = nextSuite++;
+        const result = await runTestSuite(testFiles[index], false);
+        suiteResults[index] = result;
+
+        if (!result.passed) {
+          console.log(`\n⚠️  Suite ${result.name} failed!\n`);
+          // Suites already running finish; no new ones are started
+          if (process.env.STOP_ON_FAILURE === 'true' && !stopped) {
+            stopped = true;
+            console.log('Stopping test execution due to STOP_ON_FAILURE=true\n');
+          }
+        }
+      }
+    };
+    await Promise.all(Array.from({ length: Math.min(concurrency, testFiles.length) }, worker));
+    results.push(
+      ...suiteResults.filter((result): result is TestSuiteResult => result !== undefined)
+    );
+  } else {
+    // Run test suites sequentially
+    for (let i = 0; i < testFiles.length; i++) {
+      const file = testFiles[i];
+      const name = file.split('/').pop() ?? 'unknown';
+
+      console.log('═'.repeat(60));
+      console.log(`📁 Running suite ${i + 1}/${testFiles.length}: ${name}`);
+      console.log('═'.repeat(60));
+      console.log();
+
+      const result = await runTestSuite(file);
+      results.push(result);
+
+      if (!result.passed) {
+        console.log(`\n⚠️  Suite ${name} failed!`);
+        if (process.env.STOP_ON_FAILURE === 'true') {
+          console.log('Stopping test execution due to STOP_ON_FAILURE=true');
+          break;
+        }
       }
-    }
 
-    console.log();
+      console.log();
+    }
   }
 
   const totalDuration = Date.now() - startTime;
@@ -1,5 +1,6 @@
 #!/usr/bin/env tsx
 
+import { readFileSync, renameSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
@@ -408,6 +409,63 @@ Content`;
 
       assertFailure(result);
     });
+
+    await runner.runTest('get_project_main: Lookups follow create, rename and delete', async () => {
+      // Project directories are cached by the server; every change below has
+      // to be seen by the next lookup
+      const projectId = generateTestProjectId('lookup');
+      const getContent = async (): Promise<string | null> => {
+        const result = await client.callToolAndParse('get_project_main', {
+          project_id: projectId,
+        });
+        return result.exists ? (result.content as string) : null;
+      };
+
+      assertEqual(await getContent(), null);
+      await client.callToolAndParse('update_project_main', {
+        project_id: projectId,
+        content: '# First version',
+      });
+      assertEqual(await getContent(), '# First version');
+
+      assertSuccess(await client.callToolAndParse('delete_project', { project_id: projectId }));
+      assertEqual(await getContent(), null);
+
+      await client.callToolAndParse('update_project_main', {
+        project_id: projectId,
+        content: '# Second version',
+      });
+      assertEqual(await getContent(), '# Second version');
+
+      // Rename the directory behind the server's back
+      const indexFile = join(TEST_STORAGE_PATH, 'index.json');
+      const index = JSON.parse(readFileSync(indexFile, 'utf8')) as {
+        projects: Record<string, string>;
+      };
+      const directory = index.projects[projectId];
+      renameSync(
+        join(TEST_STORAGE_PATH, 'projects', directory),
+        join(TEST_STORAGE_PATH, 'projects', `${directory}-renamed`)
+      );
+      index.projects[projectId] = `${directory}-renamed`;
+      writeFileSync(indexFile, JSON.stringify(index, null, 2));
+      assertEqual(await getContent(), '# Second version');
+
+      // Another server on the same storage deletes the project
+      const otherClient = new MCPTestClient({
+        serverPath: SERVER_PATH,
+        storagePath: TEST_STORAGE_PATH,
+      });
+      await otherClient.connect();
+      try {
+        assertSuccess(
+          await otherClient.callToolAndParse('delete_project', { project_id: projectId })
+        );
+      } finally {
+        await otherClient.disconnect();
+      }
+      assertEqual(await getContent(), null);
+    });
   } finally {
     await client.disconnect();
     cleanupTestEnvironment(TEST_STORAGE_PATH);
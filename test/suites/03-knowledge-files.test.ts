@@ -1,8 +1,16 @@
 #!/usr/bin/env tsx
 
+import { mkdirSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
+import * as yaml from 'js-yaml';
+
+import {
+  parseDocument,
+  readDocumentMetadata,
+  readDocumentMetadataAsync,
+} from '../../src/knowledge-mcp/documents.js';
 import { MCPTestClient } from '../utils/test-client.js';
 import { generateTestKnowledgeData } from '../utils/test-data-loader.js';
 import {
@@ -23,6 +31,19 @@ import {
 const TEST_STORAGE_PATH = resolve(join(homedir(), '.knowledge-mcp-test-knowledge-files'));
 const SERVER_PATH = resolve('./dist/knowledge-mcp/index.js');
 
+// JSON of a parse result that keeps dates distinct from the ISO strings
+// they serialize to, or 'invalid' when parsing throws
+function describeParse(parse: () => unknown): string {
+  try {
+    return JSON.stringify(parse(), function (this: Record<string, unknown>, key, replaced) {
+      const raw = this[key];
+      return raw instanceof Date ? { date: raw.toISOString() } : (replaced as unknown);
+    });
+  } catch {
+    return 'invalid';
+  }
+}
+
 async function main(): Promise<void> {
   const runner = new TestRunner();
   const client = new MCPTestClient({
@@ -452,6 +473,96 @@ done
       assertContains(doc.full_content as string, '**Bold text**');
       assertContains(doc.full_content as string, '| Column 1 | Column 2 |');
     });
+
+    await runner.runTest('parseDocument: Frontmatter reads the same as js-yaml', async () => {
+      // Shapes the flat-frontmatter parser accepts, and shapes it must hand
+      // over to js-yaml; either way the result has to match yaml.load
+      const frontmatters = [
+        'title: Plain title',
+        "title: 'Single ''quoted'' title'",
+        'title: "Double quoted title"',
+        'title: Title: with colon',
+        "title: 'unterminated",
+        'title: null',
+        'title: Null',
+        'title: ~',
+        'title: true',
+        'title: FALSE',
+        'title: yes',
+        'title: 42',
+        'title: 1.5e3',
+        'title: .nan',
+        'keywords: [alpha, beta]',
+        'keywords: []',
+        'keywords:\n  - alpha\n  - beta',
+        'keywords:\n- alpha\n- beta',
+        'keywords:\n  - alpha\n    - beta',
+        "keywords:\n  - 'alpha'\n  - true\n  - 7",
+        'keywords:',
+        "created: '2025-01-02T03:04:05.678Z'",
+        'created: 2025-01-02T03:04:05.678Z',
+        'updated: 2025-01-02',
+        "title: Doc\nkeywords:\n  - a\ncreated: '2025-01-02T03:04:05.678Z'",
+        'title: Doc # trailing comment',
+        'meta:\n  nested: value',
+        'title: >\n  folded\n  text',
+        'title: &anchor Doc\nalias: *anchor',
+      ];
+
+      for (const frontmatter of frontmatters) {
+        const document = `---\n${frontmatter}\n---\nBody`;
+        assertEqual(
+          describeParse(() => parseDocument(document)[0]),
+          describeParse(() => yaml.load(frontmatter) ?? {}),
+          `Frontmatter ${JSON.stringify(frontmatter)} parsed differently from js-yaml`
+        );
+      }
+    });
+
+    await runner.runTest('readDocumentMetadata: Matches a full parse', async () => {
+      // The readers stop after the chunk that closes the frontmatter, so the
+      // cases straddle the 4 KiB read size in every way that matters
+      const chunkSize = 4096;
+      const opener = '---\ntitle: ';
+      const padTo = (bytes: number): string => 'a'.repeat(bytes - Buffer.byteLength(opener));
+      const keywords = Array.from({ length: 600 }, (_, i) => `  - keyword-${i}`).join('\n');
+
+      const documents: Record<string, string> = {
+        empty: '',
+        'no frontmatter': '# Heading\n\nBody',
+        'shorter than an opener': '---\n',
+        'unclosed frontmatter': '---\ntitle: Open\nkeywords: [a]\n\nBody without a closing line',
+        'unclosed past one chunk': `${opener}${padTo(chunkSize * 2)}\n\nBody`,
+        'frontmatter past one chunk': `---\ntitle: Long\nkeywords:\n${keywords}\n---\n\nBody`,
+        'delimiter ends the chunk': `${opener}${padTo(chunkSize - 4)}\n---\n\nBody`,
+        'delimiter ends the file': `${opener}${padTo(chunkSize - 4)}\n---`,
+        // Cut after three dashes, a quoted line reads like a closing delimiter
+        'delimiter-like line at the chunk end':
+          `${opener}"${padTo(chunkSize - 5)}\n----"\nkeywords: [b]\n---\nBody`,
+      };
+      // A four-byte character starting at each offset that splits it
+      for (let offset = chunkSize - 3; offset < chunkSize; offset++) {
+        documents[`split at ${offset}`] = `${opener}${padTo(offset)}\u{1F600}é\n---\n\nBody`;
+      }
+
+      const directory = join(TEST_STORAGE_PATH, 'metadata-reads');
+      mkdirSync(directory, { recursive: true });
+      let fileNumber = 0;
+      for (const [name, content] of Object.entries(documents)) {
+        // Fresh paths keep each read from being answered by the cache
+        const syncPath = join(directory, `sync-${fileNumber}.md`);
+        const asyncPath = join(directory, `async-${fileNumber++}.md`);
+        writeFileSync(syncPath, content);
+        writeFileSync(asyncPath, content);
+
+        const expected = describeParse(() => parseDocument(content)[0]);
+        assertEqual(describeParse(() => readDocumentMetadata(syncPath)), expected, name);
+        // The second read is served from the metadata cache
+        assertEqual(describeParse(() => readDocumentMetadata(syncPath)), expected, `${name} again`);
+        const asyncMetadata = await readDocumentMetadataAsync(asyncPath);
+        assertEqual(describeParse(() => asyncMetadata), expected, `${name} async`);
+      }
+    });
   } finally {
     await client.disconnect();
     cleanupTestEnvironment(TEST_STORAGE_PATH);
@@ -1,8 +1,14 @@
 #!/usr/bin/env tsx
 
+import { readFileSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
+import {
+  parseDocument,
+  parseSections,
+  serializeDocument,
+} from '../../src/knowledge-mcp/documents.js';
 import { MCPTestClient } from '../utils/test-client.js';
 import {
   TestRunner,
@@ -41,6 +47,19 @@ async function createTestDocument(
   });
 }
 
+// Location of a knowledge file in the server's storage, for documents the
+// tools would never write themselves
+function storedKnowledgePath(projectId: string, filename: string): string {
+  const index = JSON.parse(readFileSync(join(TEST_STORAGE_PATH, 'index.json'), 'utf8')) as {
+    projects: Record<string, string>;
+  };
+  return join(TEST_STORAGE_PATH, 'projects', index.projects[projectId], 'knowledge', filename);
+}
+
+function countOccurrences(text: string, needle: string): number {
+  return text.split(needle).length - 1;
+}
+
 async function main(): Promise<void> {
   const runner = new TestRunner();
   const client = new MCPTestClient({
@@ -711,6 +730,110 @@ Special chars: <>&"' üñíçødé 你好
       assertEqual(titles[1], 'Chapter 2');
       assertEqual(titles[2], 'Chapter 3');
     });
+
+    await runner.runTest('parseSections: Introduction boundaries', async () => {
+      const chapterFirst = parseSections('## Chapter 1\n\nContent 1\n\n## Chapter 2\n\nContent 2');
+      assertEqual(chapterFirst.introduction, '');
+      assertArrayLength(chapterFirst.chapters, 2);
+
+      const introFirst = parseSections('Intro text\n\n## Chapter 1\n\nContent 1');
+      assertEqual(introFirst.introduction, 'Intro text\n');
+      assertArrayLength(introFirst.chapters, 1);
+
+      const noChapters = parseSections('Only an introduction');
+      assertEqual(noChapters.introduction, 'Only an introduction');
+      assertArrayLength(noChapters.chapters, 0);
+
+      // Lines that look like headers but are not chapters stay in the introduction
+      const deepHeader = parseSections('Intro\n##### Deep header\n##\n## Chapter 1\nContent');
+      assertEqual(deepHeader.introduction, 'Intro\n##### Deep header\n##');
+      assertArrayLength(deepHeader.chapters, 1);
+    });
+
+    await runner.runTest('add_chapter: First chapter keeps the introduction', async () => {
+      const projectId = generateTestProjectId('add-first-intro');
+
+      await client.callToolAndParse('create_knowledge_file', {
+        project_id: projectId,
+        filename: 'intro-only',
+        title: 'Intro Only',
+        introduction: 'Text written before any chapter existed',
+        keywords: ['intro'],
+        chapters: [],
+      });
+
+      const result = await client.callToolAndParse('add_chapter', {
+        project_id: projectId,
+        filename: 'intro-only.md',
+        chapter_title: 'First Chapter',
+        content: 'First chapter content',
+        position: 'end',
+      });
+      assertSuccess(result);
+
+      const doc = await client.callToolAndParse('get_knowledge_file', {
+        project_id: projectId,
+        filename: 'intro-only.md',
+      });
+      const fullContent = (doc.document as any).full_content as string;
+      assertContains(fullContent, 'Text written before any chapter existed');
+      assertArrayLength((doc.document as any).chapters as unknown[], 1);
+    });
+
+    await runner.runTest('update_chapter: Text before the first chapter is kept once', async () => {
+      const projectId = generateTestProjectId('update-intro');
+      await createTestDocument(client, projectId);
+
+      const result = await client.callToolAndParse('update_chapter', {
+        project_id: projectId,
+        filename: 'test-doc.md',
+        chapter_title: 'Chapter 2',
+        new_content: 'Updated content 2',
+      });
+      assertSuccess(result);
+
+      const doc = await client.callToolAndParse('get_knowledge_file', {
+        project_id: projectId,
+        filename: 'test-doc.md',
+      });
+      const fullContent = (doc.document as any).full_content as string;
+      assertEqual(fullContent.startsWith('Test introduction'), true);
+      assertEqual(countOccurrences(fullContent, 'Test introduction'), 1);
+      assertEqual(countOccurrences(fullContent, '## Chapter 1'), 1);
+      assertArrayLength((doc.document as any).chapters as unknown[], 3);
+    });
+
+    await runner.runTest('update_chapter: Document without an introduction', async () => {
+      const projectId = generateTestProjectId('update-no-intro');
+      await createTestDocument(client, projectId);
+
+      // Rewrite the body so it starts directly with the first chapter
+      const path = storedKnowledgePath(projectId, 'test-doc.md');
+      const [metadata] = parseDocument(readFileSync(path, 'utf8'));
+      writeFileSync(
+        path,
+        serializeDocument(metadata, '## Chapter 1\n\nContent 1\n\n## Chapter 2\n\nContent 2')
+      );
+
+      const result = await client.callToolAndParse('update_chapter', {
+        project_id: projectId,
+        filename: 'test-doc.md',
+        chapter_title: 'Chapter 2',
+        new_content: 'Updated content 2',
+      });
+      assertSuccess(result);
+
+      const doc = await client.callToolAndParse('get_knowledge_file', {
+        project_id: projectId,
+        filename: 'test-doc.md',
+      });
+      const fullContent = (doc.document as any).full_content as string;
+      assertEqual(fullContent.trim().startsWith('## Chapter 1'), true);
+      assertEqual(countOccurrences(fullContent, '## Chapter 1'), 1);
+      assertEqual(countOccurrences(fullContent, 'Content 1'), 1);
+      assertContains(fullContent, 'Updated content 2');
+      assertArrayLength((doc.document as any).chapters as unknown[], 2);
+    });
   } finally {
     await client.disconnect();
     cleanupTestEnvironment(TEST_STORAGE_PATH);
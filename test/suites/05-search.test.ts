@@ -1,8 +1,15 @@
 #!/usr/bin/env tsx
 
+import { readFileSync, statSync, utimesSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
+import {
+  loadParsedDocument,
+  searchDocuments,
+  writeDocument,
+} from '../../src/knowledge-mcp/documents.js';
+import type { SearchResult } from '../../src/knowledge-mcp/documents.js';
 import { MCPTestClient } from '../utils/test-client.js';
 import {
   TestRunner,
@@ -18,6 +25,40 @@ import {
 const TEST_STORAGE_PATH = resolve(join(homedir(), '.knowledge-mcp-test-search'));
 const SERVER_PATH = resolve('./dist/knowledge-mcp/index.js');
 
+// Project directory searched in-process, for checks the search tool's
+// response is too coarse for (it reports no match contexts)
+const DIRECT_PROJECT_PATH = resolve(join(homedir(), '.knowledge-mcp-test-search-direct'));
+
+function writeDirectDocument(filename: string, body: string): string {
+  const path = join(DIRECT_PROJECT_PATH, 'knowledge', filename);
+  writeDocument(path, { title: filename }, body);
+  return path;
+}
+
+// Match contexts of one file, keyed by chapter and keyword
+function collectContexts(results: SearchResult[], file: string): Record<string, string[]> {
+  const contexts: Record<string, string[]> = {};
+  for (const result of results.filter((r) => r.file === file)) {
+    for (const chapter of result.matching_chapters) {
+      for (const [keyword, found] of Object.entries(chapter.match_context)) {
+        contexts[`${chapter.chapter} / ${keyword}`] = found;
+      }
+    }
+  }
+  return contexts;
+}
+
+// The context search builds for a match at an offset of the original text
+function expectedContext(text: string, start: number, length: number): string {
+  const from = Math.max(0, start - 50);
+  const to = Math.min(text.length, start + length + 50);
+  return (from > 0 ? '...' : '') + text.slice(from, to).trim() + (to < text.length ? '...' : '');
+}
+
+function sortedEntries(record: Record<string, string[]>): [string, string[]][] {
+  return Object.entries(record).sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+}
+
 // Create test documents for searching
 async function setupSearchTestData(client: MCPTestClient, projectId: string): Promise<void> {
   // Document 1: TypeScript guide
@@ -126,6 +167,7 @@ async function main(): Promise<void> {
 
   // Setup
   setupTestEnvironment(TEST_STORAGE_PATH);
+  setupTestEnvironment(DIRECT_PROJECT_PATH);
   await client.connect();
   client.setTestRunner(runner);
   try {
@@ -429,9 +471,211 @@ And this is the end of the chapter content with more text.`,
       assertEqual(results[0].chapters[0].title, 'Chapter with Summary');
       assertEqual(results[0].chapters[0].matches, 1);
     });
+
+    await runner.runTest('search_knowledge: Follows edits to the project index', async () => {
+      // The server caches index.json by mtime and size; each edit below
+      // changes only one of the two
+      const firstId = generateTestProjectId('index-first');
+      const secondId = generateTestProjectId('index-second');
+      const projects = [
+        { projectId: firstId, word: 'marmalade' },
+        { projectId: secondId, word: 'quicksilver' },
+      ];
+      for (const { projectId, word } of projects) {
+        await client.callToolAndParse('create_knowledge_file', {
+          project_id: projectId,
+          filename: 'index-edit',
+          title: 'Index Edit',
+          introduction: `Introduction mentioning ${word}`,
+          keywords: ['index'],
+          chapters: [{ title: 'Chapter', content: `Content about ${word}` }],
+        });
+      }
+
+      const countFirstProjectMatches = async (query: string): Promise<number> => {
+        const result = await client.callToolAndParse('search_knowledge', {
+          project_id: firstId,
+          query,
+        });
+        assertSuccess(result);
+        return result.total_documents as number;
+      };
+      assertEqual(await countFirstProjectMatches('marmalade'), 1);
+      assertEqual(await countFirstProjectMatches('quicksilver'), 0);
+
+      const indexFile = join(TEST_STORAGE_PATH, 'index.json');
+      const original = readFileSync(indexFile, 'utf8');
+      const originalStats = statSync(indexFile);
+      const index = JSON.parse(original) as { projects: Record<string, string> };
+
+      // Swapping the two directories keeps the size; only the mtime moves
+      const firstDirectory = index.projects[firstId];
+      index.projects[firstId] = index.projects[secondId];
+      index.projects[secondId] = firstDirectory;
+      writeFileSync(indexFile, JSON.stringify(index, null, 2));
+      utimesSync(indexFile, originalStats.atime, new Date(originalStats.mtimeMs + 10_000));
+      const swappedStats = statSync(indexFile);
+      assertEqual(swappedStats.size, originalStats.size);
+      assertEqual(await countFirstProjectMatches('quicksilver'), 1);
+      assertEqual(await countFirstProjectMatches('marmalade'), 0);
+
+      // Restoring the mapping with wider indentation keeps the mtime; only
+      // the size moves
+      writeFileSync(indexFile, JSON.stringify(JSON.parse(original), null, 4));
+      utimesSync(indexFile, swappedStats.atime, swappedStats.mtime);
+      assertEqual(statSync(indexFile).mtimeMs, swappedStats.mtimeMs);
+      assertEqual(await countFirstProjectMatches('marmalade'), 1);
+      assertEqual(await countFirstProjectMatches('quicksilver'), 0);
+    });
+
+    await runner.runTest('searchDocuments: Large keyword sets match per keyword', async () => {
+      const file = 'many-keywords.md';
+      writeDirectDocument(
+        file,
+        [
+          'Before the chapters: she sells seashells, hers and his.',
+          '',
+          '## Overlaps',
+          '',
+          'abababab aaaa nodejs node no-de NODE',
+          '',
+          '## Unicode',
+          '',
+          'Die Straße in München, ein Café, данные и ДАННЫЕ, 日本語の文書',
+        ].join('\n')
+      );
+
+      // 16 or more distinct keywords switch to the Aho-Corasick matcher.
+      // They overlap, prefix each other and leave the ASCII range.
+      const keywords = [
+        'he',
+        'she',
+        'his',
+        'hers',
+        'abab',
+        'baba',
+        'aa',
+        'aaa',
+        'no',
+        'node',
+        'nodejs',
+        'straße',
+        'münchen',
+        'café',
+        'данные',
+        '日本',
+        '本語',
+        'absent',
+      ];
+
+      const query = keywords.join(' ');
+      const combined = collectContexts(searchDocuments(DIRECT_PROJECT_PATH, query), file);
+
+      // Fewer keywords are matched with one indexOf scan each
+      const separate: Record<string, string[]> = {};
+      for (const keyword of keywords) {
+        const results = searchDocuments(DIRECT_PROJECT_PATH, keyword);
+        Object.assign(separate, collectContexts(results, file));
+      }
+
+      assertEqual(JSON.stringify(sortedEntries(combined)), JSON.stringify(sortedEntries(separate)));
+
+      // Overlapping occurrences are all reported
+      assertEqual(combined['Overlaps / abab'].length, 3);
+      assertEqual(combined['Overlaps / aa'].length, 3);
+      assertEqual(combined['Overlaps / node'].length, 3);
+      assertEqual(combined['Unicode / straße'].length, 1);
+      assertEqual(combined['Unicode / данные'].length, 2);
+      assertEqual(combined[' / hers'].length, 1);
+      assertEqual(combined['Overlaps / absent'], undefined);
+    });
+
+    await runner.runTest('searchDocuments: Contexts around folds that change length', async () => {
+      // ß folds to two characters, İ lowercases to i plus a combining dot,
+      // and a decomposed é composes to one character, so folded offsets
+      // drift from the original ones as the text goes on
+      const padding = 'x'.repeat(60);
+      const path = writeDirectDocument(
+        'folding.md',
+        `${padding} İstanbul, große Straße, Cafe\u0301 und STRASSE heißen ${padding}`
+      );
+      const { body } = loadParsedDocument(path);
+
+      // Contexts of a single-keyword search
+      const search = (query: string): string[] =>
+        Object.values(
+          collectContexts(searchDocuments(DIRECT_PROJECT_PATH, query), 'folding.md')
+        ).flat();
+
+      const at = (original: string, from = 0): string =>
+        expectedContext(body, body.indexOf(original, from), original.length);
+
+      assertEqual(JSON.stringify(search('İSTANBUL')), JSON.stringify([at('İstanbul')]));
+      assertEqual(JSON.stringify(search('straße')), JSON.stringify([at('Straße'), at('STRASSE')]));
+      assertEqual(JSON.stringify(search('café')), JSON.stringify([at('Cafe\u0301')]));
+      assertEqual(JSON.stringify(search('HEISSEN')), JSON.stringify([at('heißen')]));
+      assertEqual(JSON.stringify(search('grosse')), JSON.stringify([at('große')]));
+
+      // Results are keyed by the lowercased query token, not its folded form
+      const [chapter] = searchDocuments(DIRECT_PROJECT_PATH, 'Straße HEISSEN')
+        .filter((result) => result.file === 'folding.md')
+        .flatMap((result) => result.matching_chapters);
+      assertEqual(JSON.stringify(chapter.keywords_found), '["heissen","straße"]');
+      assertEqual(JSON.stringify(Object.keys(chapter.match_context)), '["straße","heissen"]');
+    });
+
+    await runner.runTest('searchDocuments: Introduction ends at the first chapter', async () => {
+      writeDirectDocument(
+        'chapter-first.md',
+        '## First\n\nalpha is only here\n\n## Second\n\nbeta is only here'
+      );
+      writeDirectDocument(
+        'deep-header.md',
+        'Intro line\n##### Deep header with gamma\n\n## Chapter\n\nChapter text'
+      );
+
+      const chaptersFound = (query: string, file: string): string[] =>
+        searchDocuments(DIRECT_PROJECT_PATH, query)
+          .filter((result) => result.file === file)
+          .flatMap((result) => result.matching_chapters.map((chapter) => chapter.chapter));
+
+      // A body that starts with a chapter has no introduction to match again
+      assertEqual(JSON.stringify(chaptersFound('alpha', 'chapter-first.md')), '["First"]');
+
+      // A deeper header is not a chapter, so its line belongs to the introduction
+      assertEqual(JSON.stringify(chaptersFound('gamma', 'deep-header.md')), '[""]');
+    });
+
+    await runner.runTest('searchDocuments: Parses leaving the cache drop their index', async () => {
+      // Dropping an index clears searchIndex and its budget entry together,
+      // so a cleared field shows the old parse no longer holds on to one
+      const path = writeDirectDocument('stale-index.md', 'Original text with kumquat');
+      assertEqual(searchDocuments(DIRECT_PROJECT_PATH, 'kumquat').length, 1);
+      const original = loadParsedDocument(path);
+      assertEqual(original.searchIndex !== undefined, true);
+
+      // Same size, later mtime: edited behind the cache
+      const stats = statSync(path);
+      writeFileSync(path, readFileSync(path, 'utf8').replace('kumquat', 'rambutan'));
+      utimesSync(path, stats.atime, new Date(stats.mtimeMs + 10_000));
+      assertEqual(searchDocuments(DIRECT_PROJECT_PATH, 'rambutan').length, 1);
+      assertEqual(original.searchIndex, undefined);
+
+      const edited = loadParsedDocument(path);
+      assertEqual(edited !== original && edited.searchIndex !== undefined, true);
+
+      // Parses pushed out of the cache by newer ones let go of theirs too
+      for (let i = 0; i < 1024; i++) {
+        const fillerPath = join(DIRECT_PROJECT_PATH, 'filler', `filler-${i}.md`);
+        writeDocument(fillerPath, { title: 'Filler' }, 'Filler');
+        loadParsedDocument(fillerPath);
+      }
+      assertEqual(edited.searchIndex, undefined);
+    });
   } finally {
     await client.disconnect();
     cleanupTestEnvironment(TEST_STORAGE_PATH);
+    cleanupTestEnvironment(DIRECT_PROJECT_PATH);
 
     // Export detailed results for HTML reporting
     const detailedSuiteResult = runner.getDetailedSuiteResult();
@@ -1,5 +1,6 @@
 #!/usr/bin/env tsx
 
+import { chmodSync, mkdirSync, readFileSync, symlinkSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
@@ -20,6 +21,14 @@ import {
 const TEST_STORAGE_PATH = resolve(join(homedir(), '.knowledge-mcp-test-resources'));
 const SERVER_PATH = resolve('./dist/knowledge-mcp/index.js');
 
+// Knowledge directory of a project, looked up through the storage index
+function knowledgeDirectory(projectId: string): string {
+  const index = JSON.parse(readFileSync(join(TEST_STORAGE_PATH, 'index.json'), 'utf8')) as {
+    projects: Record<string, string>;
+  };
+  return join(TEST_STORAGE_PATH, 'projects', index.projects[projectId], 'knowledge');
+}
+
 async function main(): Promise<void> {
   const runner = new TestRunner();
   const client = new MCPTestClient({
@@ -81,15 +90,80 @@ async function main(): Promise<void> {
       }
 
       // The resource URI would be: knowledge://projects/{project_id}/files
-      // We verify by checking all files can be retrieved
-      for (const file of files) {
-        const result = await client.callToolAndParse('get_knowledge_file', {
-          project_id: projectId,
-          filename: `${file.filename}.md`,
-        });
-
+      // We verify by checking all files can be retrieved; the reads are
+      // independent, so they go out together
+      const results = await Promise.all(
+        files.map((file) =>
+          client.callToolAndParse('get_knowledge_file', {
+            project_id: projectId,
+            filename: `${file.filename}.md`,
+          })
+        )
+      );
+
+      results.forEach((result, i) => {
         assertSuccess(result);
-        assertEqual((result.document as any).metadata.title, file.title);
+        assertEqual((result.document as any).metadata.title, files[i].title);
+      });
+    });
+
+    await runner.runTest('Resource listing: Symlinked knowledge files', async () => {
+      const projectId = generateTestProjectId('resource-links');
+
+      await client.callToolAndParse('create_knowledge_file', {
+        project_id: projectId,
+        filename: 'real',
+        title: 'Real File',
+        introduction: 'Target of a link',
+        keywords: ['links'],
+        chapters: [{ title: 'Chapter 1', content: 'Content 1' }],
+      });
+
+      const knowledgePath = knowledgeDirectory(projectId);
+      const outsidePath = join(TEST_STORAGE_PATH, 'outside.md');
+      writeFileSync(outsidePath, '---\ntitle: Outside\n---\n\nNot part of the project\n');
+      mkdirSync(join(knowledgePath, 'folder.md'));
+
+      // Only the link that stays inside and points at a file is listed
+      symlinkSync('real.md', join(knowledgePath, 'linked.md'));
+      symlinkSync(outsidePath, join(knowledgePath, 'outside.md'));
+      symlinkSync('folder.md', join(knowledgePath, 'folder-link.md'));
+      symlinkSync('missing.md', join(knowledgePath, 'broken.md'));
+
+      const text = await client.readResource(`knowledge://projects/${projectId}/files`);
+      const files = JSON.parse(text) as Array<{ filename: string; title: string }>;
+      const listed = files.map((file) => `${file.filename}: ${file.title}`).sort();
+      assertEqual(
+        JSON.stringify(listed),
+        JSON.stringify(['linked.md: Real File', 'real.md: Real File'])
+      );
+    });
+
+    await runner.runTest('Resource listing: Unreadable knowledge file', async () => {
+      const projectId = generateTestProjectId('resource-unreadable');
+
+      await client.callToolAndParse('create_knowledge_file', {
+        project_id: projectId,
+        filename: 'readable',
+        title: 'Readable File',
+        introduction: 'Listed as usual',
+        keywords: ['listing'],
+        chapters: [{ title: 'Chapter 1', content: 'Content 1' }],
+      });
+
+      const lockedPath = join(knowledgeDirectory(projectId), 'locked.md');
+      writeFileSync(lockedPath, '---\ntitle: Locked\n---\n\nCannot be read\n');
+      chmodSync(lockedPath, 0o000);
+      try {
+        // One file failing to open skips that file, not the whole listing
+        const text = await client.readResource(`knowledge://projects/${projectId}/files`);
+        const files = JSON.parse(text) as Array<{ filename: string }>;
+        const listed = files.map((file) => file.filename);
+        assertEqual(listed.includes('readable.md'), true);
+        // Root reads the file regardless of its mode
+        assertEqual(listed.includes('locked.md'), process.getuid?.() === 0);
+      } finally {
+        chmodSync(lockedPath, 0o644);
       }
     });
 
@@ -1,9 +1,17 @@
 #!/usr/bin/env tsx
 
+import { execFileSync } from 'child_process';
+import { mkdirSync, writeFileSync } from 'fs';
 import { access, readFile } from 'fs/promises';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
+import {
+  clearGitRemoteUrlCache,
+  getGitRemoteUrl,
+  getProjectId,
+} from '../../src/knowledge-mcp/projectId.js';
+import { autoCommitAsync, initializeStorageAsync } from '../../src/knowledge-mcp/utils.js';
 import { MCPTestClient } from '../utils/test-client.js';
 import {
   TestRunner,
@@ -19,6 +27,8 @@ import {
 // Test configuration
 const TEST_STORAGE_PATH = resolve(join(homedir(), '.knowledge-mcp-test-server'));
 const SERVER_PATH = resolve('./dist/knowledge-mcp/index.js');
+// Repositories driven in-process, kept out of the server's storage repository
+const LOCAL_REPOS_PATH = resolve(join(homedir(), '.knowledge-mcp-test-server-repos'));
 
 async function main(): Promise<void> {
   const runner = new TestRunner();
@@ -29,6 +39,7 @@ async function main(): Promise<void> {
 
   // Setup
   setupTestEnvironment(TEST_STORAGE_PATH);
+  setupTestEnvironment(LOCAL_REPOS_PATH);
   await client.connect();
   client.setTestRunner(runner);
   try {
@@ -208,6 +219,98 @@ async function main(): Promise<void> {
       }
     });
 
+    await runner.runTest('Server storage: Concurrent writes are all committed', async () => {
+      const projectId = generateTestProjectId('batch-commit');
+
+      // Register the project first so the concurrent writes only add files
+      await client.callToolAndParse('update_project_main', {
+        project_id: projectId,
+        content: `# Project ${projectId}\n\nBatched commit test.`,
+      });
+
+      // Writes arriving while a commit runs are merged into one batch commit
+      const filenames = Array.from({ length: 6 }, (_, i) => `batch-doc-${i}`);
+      const results = await Promise.all(
+        filenames.map((filename) =>
+          client.callToolAndParse('create_knowledge_file', {
+            project_id: projectId,
+            filename,
+            title: `Batch ${filename}`,
+            introduction: 'Written concurrently',
+            keywords: ['batch'],
+            chapters: [{ title: 'Chapter 1', content: 'Content 1' }],
+          })
+        )
+      );
+      results.forEach((result, i) => {
+        assertSuccess(result, `Write ${i} failed`);
+      });
+
+      // Nothing may be left uncommitted
+      const status = await client.callToolAndParse('get_storage_status', {});
+      assertSuccess(status);
+      assertEqual(status.has_changes, false, `Uncommitted changes: ${status.status_details}`);
+
+      // Every change is named in the history, whichever commits they shared
+      const log = execFileSync('git', ['log', '--format=%B'], {
+        cwd: TEST_STORAGE_PATH,
+        encoding: 'utf8',
+      });
+      for (const filename of filenames) {
+        assertContains(log, `Create knowledge file ${filename}.md in ${projectId}`);
+      }
+    });
+
+    await runner.runTest('autoCommitAsync: Calls in one tick share a batch commit', async () => {
+      const repoPath = join(LOCAL_REPOS_PATH, 'batch-repo');
+      await initializeStorageAsync(repoPath);
+
+      // No commit can start before the current tick ends, so every call made
+      // in it joins the first one's batch
+      const messages = ['First change', 'Second change with $HOME', 'Third "quoted" change'];
+      const commits = messages.map((message, i) => {
+        writeFileSync(join(repoPath, `change-${i}.md`), message);
+        return autoCommitAsync(repoPath, message);
+      });
+      await Promise.all(commits);
+
+      const git = (...args: string[]): string =>
+        execFileSync('git', args, { cwd: repoPath, encoding: 'utf8' });
+      assertEqual(git('status', '--porcelain'), '');
+      assertEqual(
+        git('log', '-1', '--format=%B').trim(),
+        `Batch update: 3 changes\n\n${messages.map((message) => `- ${message}`).join('\n')}`
+      );
+      assertEqual(git('rev-list', '--count', 'HEAD').trim(), '2');
+    });
+
+    await runner.runTest('getProjectId: Remote lookups are cached until cleared', async () => {
+      const repoPath = join(LOCAL_REPOS_PATH, 'remote-lookup');
+      mkdirSync(repoPath, { recursive: true });
+      const git = (...args: string[]): string =>
+        execFileSync('git', args, { cwd: repoPath, encoding: 'utf8' });
+      git('init', '--quiet');
+
+      const previousDir = process.cwd();
+      process.chdir(repoPath);
+      try {
+        clearGitRemoteUrlCache();
+        assertEqual(getGitRemoteUrl(), null);
+        assertEqual(getProjectId(), 'remote-lookup');
+
+        // The cached answer, null included, holds until the cache is cleared
+        git('remote', 'add', 'origin', 'https://example.com/team/remote-lookup.git');
+        assertEqual(getGitRemoteUrl(), null);
+
+        clearGitRemoteUrlCache();
+        assertEqual(getGitRemoteUrl(), 'https://example.com/team/remote-lookup.git');
+        assertEqual(getProjectId(), 'https://example.com/team/remote-lookup.git');
+      } finally {
+        process.chdir(previousDir);
+        clearGitRemoteUrlCache();
+      }
+    });
+
     await runner.runTest('Server persistence: Data survives restart', async () => {
       const projectId = generateTestProjectId('persist');
       const content = '# Persistence Test\n\nThis should survive restart.';
@@ -326,6 +429,7 @@ async function main(): Promise<void> {
   } finally {
     await client.disconnect();
     cleanupTestEnvironment(TEST_STORAGE_PATH);
+    cleanupTestEnvironment(LOCAL_REPOS_PATH);
 
     // Export detailed results for HTML reporting
     const detailedSuiteResult = runner.getDetailedSuiteResult();
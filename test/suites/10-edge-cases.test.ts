@@ -1,8 +1,10 @@
 #!/usr/bin/env tsx
 
+import { mkdirSync, writeFileSync } from 'fs';
 import { homedir } from 'os';
 import { resolve, join } from 'path';
 
+import { validatePath, validatePathAsync } from '../../src/knowledge-mcp/utils.js';
 import { MCPTestClient } from '../utils/test-client.js';
 import {
   TestRunner,
@@ -481,6 +483,18 @@ Content directly under section 2`;
         }
       }
     });
+
+    await runner.runTest('Edge case: Validated path below a file', async () => {
+      // realpath fails with ENOTDIR here; like a missing path, it is one
+      // that simply hasn't been created
+      const basePath = join(TEST_STORAGE_PATH, 'validate-path');
+      mkdirSync(basePath, { recursive: true });
+      writeFileSync(join(basePath, 'file.md'), 'Not a directory');
+
+      const expected = join(basePath, 'file.md', 'child.md');
+      assertEqual(validatePath(basePath, 'file.md/child.md'), expected);
+      assertEqual(await validatePathAsync(basePath, 'file.md/child.md'), expected);
+    });
   } finally {
     await client.disconnect();
     cleanupTestEnvironment(TEST_STORAGE_PATH);
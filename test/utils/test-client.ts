@@ -7,20 +7,28 @@ interface MCPRequest {
   jsonrpc: '2.0';
   id: number;
   method: string;
-  params: {
-    name: string;
-    arguments: Record<string, unknown>;
-  };
+  params:
+    | {
+        name: string;
+        arguments: Record<string, unknown>;
+      }
+    | {
+        uri: string;
+      };
 }
 
 interface MCPResponse {
   jsonrpc: '2.0';
   id: number;
   result?: {
-    content: Array<{
+    content?: Array<{
       type: string;
       text: string;
     }>;
+    contents?: Array<{
+      uri: string;
+      text: string;
+    }>;
   };
   error?: {
     code: number;
@@ -183,6 +191,50 @@ export class MCPTestClient {
     });
   }
 
+  // Reads a resource and returns the text of its first content entry
+  async readResource(uri: string): Promise<string> {
+    if (!this.isConnected) {
+      throw new Error('Client not connected');
+    }
+
+    const id = this.requestId++;
+    const request: MCPRequest = {
+      jsonrpc: '2.0',
+      id,
+      method: 'resources/read',
+      params: { uri },
+    };
+
+    this.server?.stdin?.write(JSON.stringify(request) + '\n');
+
+    return new Promise<string>((resolve, reject) => {
+      const timeout = setTimeout(() => {
+        reject(new Error(`Timeout waiting for resource ${uri}`));
+      }, this.options.timeout);
+
+      const checkResponse = (): void => {
+        const response = this.responses.get(id);
+        if (!response) {
+          setTimeout(checkResponse, 100);
+          return;
+        }
+        clearTimeout(timeout);
+        this.responses.delete(id);
+
+        const text = response.result?.contents?.[0]?.text;
+        if (response.error) {
+          reject(new Error(`Resource error: ${JSON.stringify(response.error)}`));
+        } else if (text !== undefined) {
+          resolve(text);
+        } else {
+          reject(new Error('Invalid response format'));
+        }
+      };
+
+      checkResponse();
+    });
+  }
+
   // Convenience method for tool calls that returns parsed result
   async callToolAndParse(
     toolName: string,
@@ -1,4 +1,4 @@
-import { existsSync, rmSync, mkdirSync } from 'fs';
+import { rmSync, mkdirSync } from 'fs';
 
 // Test result tracking
 export interface TestResult {
@@ -109,10 +109,8 @@ export function assertArrayLength<T>(array: T[], expectedLength: number, message
 
 // Test environment helpers
 export function setupTestEnvironment(storagePath: string): void {
-  // Clean up any existing test data
-  if (existsSync(storagePath)) {
-    rmSync(storagePath, { recursive: true, force: true });
-  }
+  // Clean up any existing test data; force makes a missing path a no-op
+  rmSync(storagePath, { recursive: true, force: true });
 
   // Create fresh test environment
   mkdirSync(storagePath, { recursive: true });
@@ -120,9 +118,7 @@ export function setupTestEnvironment(storagePath: string): void {
 
 export function cleanupTestEnvironment(storagePath: string): void {
   // Clean up test data
-  if (existsSync(storagePath)) {
-    rmSync(storagePath, { recursive: true, force: true });
-  }
+  rmSync(storagePath, { recursive: true, force: true });
 }
 
 // Test runner helpers